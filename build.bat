@@ -38,6 +38,15 @@ if errorlevel 1 (
     pip install pyinstaller --quiet
 )
 
+REM Losslessly shrink the bundled PNGs (optional - skipped if oxipng is not installed)
+where oxipng >nul 2>&1
+if errorlevel 1 (
+    echo oxipng not found - skipping PNG optimization
+) else (
+    echo Optimizing PNG assets...
+    oxipng -o max --strip safe -r src\hamal\ui\assets\icons
+)
+
 REM Run PyInstaller
 echo.
 echo Building HAMAL...
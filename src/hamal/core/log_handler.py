@@ -1,5 +1,6 @@
 """Log handling and persistence for project output."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, TextIO
@@ -58,6 +59,7 @@ class LogHandler:
     def get_all_log_files(self) -> list[Path]:
         """Get all log files for this project, sorted by date (newest first)."""
         logs_dir = get_project_logs_dir(self.project_id)
-        log_files = list(logs_dir.glob("*.log"))
-        log_files.sort(reverse=True)  # Newest first
-        return log_files
+        # Filenames are timestamps, so sorting the bare names is enough
+        with os.scandir(logs_dir) as it:
+            names = sorted((e.name for e in it if e.name.endswith(".log")), reverse=True)
+        return [logs_dir / name for name in names]  # Newest first
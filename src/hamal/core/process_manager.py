@@ -4,9 +4,13 @@ import logging
 import os
 import subprocess
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -14,6 +18,10 @@ from hamal.core.log_handler import LogHandler
 from hamal.database.models import Project
 
 
+# Seconds a process gets to exit after terminate() before it is killed
+STOP_TIMEOUT = 5
+
+
 class ProcessStatus(Enum):
     """Runtime status of a project process."""
     STOPPED = "stopped"
@@ -30,7 +38,8 @@ class ProcessInfo:
     start_time: datetime
     log_handler: LogHandler
     reader_thread: Optional[threading.Thread] = None
-    recent_logs: list = field(default_factory=list)
+    # Bounded tail of output used for crash reports (oldest lines drop off in O(1))
+    recent_logs: deque = field(default_factory=lambda: deque(maxlen=150))
 
     # Error detection patterns
     ERROR_PATTERNS = ["Traceback", "Error:", "Exception:", "error:", "CRITICAL", "FATAL"]
@@ -38,8 +47,6 @@ class ProcessInfo:
     def add_log(self, line: str):
         """Add a log line, keeping only last 150 lines."""
         self.recent_logs.append(line)
-        if len(self.recent_logs) > 150:
-            self.recent_logs.pop(0)
 
     def get_recent_logs(self) -> str:
         """Get recent logs as a string."""
@@ -56,9 +63,9 @@ class ProcessInfo:
             if error_start_idx is not None:
                 break
 
-        if error_start_idx is not None:
-            return "\n".join(self.recent_logs[error_start_idx:])
-        return "\n".join(self.recent_logs[-30:])
+        if error_start_idx is None:
+            error_start_idx = max(len(self.recent_logs) - 30, 0)
+        return "\n".join(islice(self.recent_logs, error_start_idx, None))
 
 
 class ProcessManager:
@@ -72,6 +79,10 @@ class ProcessManager:
         self._processes: dict[int, ProcessInfo] = {}
         self._project_names: dict[int, str] = {}
         self._lock = threading.Lock()
+        # Ids reserved by a start in progress (between the running check and Popen)
+        self._starting: set[int] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None  # Created on first start_all
+        self._start_generation = 0  # Bumped by stop_all to cancel starts it can't see yet
 
         # Callbacks (set by UI)
         self.on_status_changed: Optional[Callable[[int, str], None]] = None
@@ -104,11 +115,68 @@ class ProcessManager:
 
             return (datetime.now() - info.start_time).total_seconds()
 
+    def get_all_statuses(self) -> dict[int, tuple[ProcessStatus, Optional[float]]]:
+        """
+        Get (status, uptime in seconds) for every tracked project under one lock.
+        Projects that are not tracked are stopped and have no uptime.
+        """
+        now = datetime.now()
+        statuses = {}
+        with self._lock:
+            for project_id, info in self._processes.items():
+                if info.process.poll() is None:
+                    statuses[project_id] = (
+                        ProcessStatus.RUNNING, (now - info.start_time).total_seconds()
+                    )
+                elif info.process.returncode != 0:
+                    statuses[project_id] = (ProcessStatus.CRASHED, None)
+                else:
+                    statuses[project_id] = (ProcessStatus.STOPPED, None)
+        return statuses
+
     def start_project(self, project: Project) -> bool:
         """Start a project subprocess."""
         # pylint: disable=logging-fstring-interpolation
         logger = logging.getLogger(__name__)
 
+        with self._lock:
+            reserved = self._reserve_locked(project.id)
+            generation = self._start_generation
+        if not reserved:
+            logger.warning(f"  [SKIP] Process already running or starting for {project.name}")
+            return False
+
+        return self._start_reserved(project, generation)
+
+    def _reserve_locked(self, project_id: int) -> bool:
+        """
+        Reserve an id for starting unless it is running or already being started.
+        Must be called with self._lock held.
+        """
+        if project_id in self._starting:
+            return False
+        existing = self._processes.get(project_id)
+        if existing is not None and existing.process.poll() is None:
+            return False
+        self._starting.add(project_id)
+        return True
+
+    def _start_reserved(self, project: Project, generation: int) -> bool:
+        """Start a project whose id was reserved, releasing the reservation when done."""
+        try:
+            with self._lock:
+                if generation != self._start_generation:
+                    return False  # Cancelled by stop_all before it began
+            return self._spawn(project, generation)
+        finally:
+            with self._lock:
+                self._starting.discard(project.id)
+
+    def _spawn(self, project: Project, generation: int) -> bool:
+        """Launch the subprocess and its reader/monitor threads."""
+        # pylint: disable=logging-fstring-interpolation
+        logger = logging.getLogger(__name__)
+
         # === DEBUG LOGGING ===
         logger.info("="*50)
         logger.info(f"[START_PROJECT] Attempting to start: {project.name}")
@@ -118,13 +186,6 @@ class ProcessManager:
         logger.info(f"  interpreter_path: {project.interpreter_path}")
         # === END DEBUG ===
 
-        with self._lock:
-            if project.id in self._processes:
-                existing = self._processes[project.id]
-                if existing.process.poll() is None:
-                    logger.warning(f"  [SKIP] Process already running for {project.name}")
-                    return False
-
         self._emit_status(project.id, ProcessStatus.STARTING.value)
 
         try:
@@ -172,6 +233,26 @@ class ProcessManager:
                 log_handler=log_handler
             )
 
+            # Registered together with the generation check, so stop_all either sees
+            # this process or the process sees that stop_all ran
+            with self._lock:
+                cancelled = generation != self._start_generation
+                if not cancelled:
+                    self._processes[project.id] = info
+                    self._project_names[project.id] = project.name
+            if cancelled:
+                # stop_all already ran and couldn't see this process, so stop it here;
+                # terminate first, as the status callback may fail once the UI is gone
+                process.terminate()
+                try:
+                    process.wait(timeout=STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                log_handler.stop_logging()
+                self._emit_status(project.id, ProcessStatus.STOPPED.value)
+                return False
+
             stdout_thread = threading.Thread(
                 target=self._read_output,
                 args=(project.id, process.stdout, "stdout"),
@@ -192,10 +273,6 @@ class ProcessManager:
             )
             monitor_thread.start()
 
-            with self._lock:
-                self._processes[project.id] = info
-                self._project_names[project.id] = project.name
-
             self._emit_status(project.id, ProcessStatus.RUNNING.value)
             return True
 
@@ -204,6 +281,27 @@ class ProcessManager:
             self._emit_status(project.id, ProcessStatus.STOPPED.value)
             return False
 
+    def start_all(self, projects: list[Project]) -> int:
+        """
+        Start every project that is not already running, without blocking the caller.
+        Spawns run in parallel on a worker pool; progress arrives via on_status_changed.
+        Returns the number of projects submitted.
+        """
+        # Reserved here, so a second Start All or a row Play can't launch them again
+        # before the workers get to them
+        with self._lock:
+            to_start = [project for project in projects if self._reserve_locked(project.id)]
+            generation = self._start_generation
+
+        if to_start and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(8, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="hamal-start"
+            )
+        for project in to_start:
+            self._executor.submit(self._start_reserved, project, generation)
+        return len(to_start)
+
     def _emit_status(self, project_id: int, status: str):
         """Emit status change via callback."""
         if self.on_status_changed:
@@ -230,30 +328,74 @@ class ProcessManager:
             info.process.terminate()
 
             try:
-                info.process.wait(timeout=5)
+                info.process.wait(timeout=STOP_TIMEOUT)
             except subprocess.TimeoutExpired:
                 info.process.kill()
                 info.process.wait()
 
-            info.log_handler.stop_logging()
-
-            with self._lock:
-                del self._processes[project_id]
-
-            self._emit_status(project_id, ProcessStatus.STOPPED.value)
+            self._finish_stop(project_id, info)
             return True
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             self._emit_log(project_id, f"[ERROR] Failed to stop: {e}")
             return False
 
-    def stop_all(self):
-        """Stop all running projects."""
+    def _finish_stop(self, project_id: int, info: ProcessInfo):
+        """Close the log and forget a process that has exited."""
+        info.log_handler.stop_logging()
+
         with self._lock:
+            # The monitor thread may already have removed it
+            if self._processes.get(project_id) is info:
+                del self._processes[project_id]
+
+        self._emit_status(project_id, ProcessStatus.STOPPED.value)
+
+    def stop_all(self, parallel: bool = False):
+        """
+        Stop all running projects.
+
+        With parallel=True every process is sent terminate() first and then waited
+        for against one shared deadline, so stopping takes as long as the slowest
+        process rather than the sum of all of them. This stays on the calling
+        thread: status callbacks may need the Tk thread, which is the caller.
+
+        Starts still queued by start_all are cancelled; one already launching
+        stops its own process instead of being waited for here, since waiting
+        could block on a status callback that needs this thread.
+        """
+        with self._lock:
+            self._start_generation += 1
             project_ids = list(self._processes.keys())
 
+        if not parallel:
+            for project_id in project_ids:
+                self.stop_project(project_id)
+            return
+
+        stopping = []
         for project_id in project_ids:
-            self.stop_project(project_id)
+            with self._lock:
+                info = self._processes.get(project_id)
+            if info is None or info.process.poll() is not None:
+                continue
+
+            self._emit_status(project_id, ProcessStatus.STOPPING.value)
+            try:
+                info.process.terminate()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._emit_log(project_id, f"[ERROR] Failed to stop: {e}")
+                continue
+            stopping.append((project_id, info))
+
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for project_id, info in stopping:
+            try:
+                info.process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                info.process.kill()
+                info.process.wait()
+            self._finish_stop(project_id, info)
 
     def _read_output(self, project_id: int, stream, stream_name: str):
         """Read output from a subprocess stream."""
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -63,6 +64,20 @@ VENV_INTERPRETER_PATHS = [
     ".env/Scripts/python.exe",
 ]
 
+# File extensions listed as runnable scripts
+SCRIPT_EXTENSIONS = {".py", ".js", ".ts", ".go", ".php", ".rb"}
+
+# Language detection by entrypoint file extension (without the dot)
+LANGUAGE_BY_EXT = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "go": "go",
+    "php": "php",
+    "rb": "ruby",
+    "java": "java",
+}
+
 
 @dataclass
 class ScanResult:
@@ -73,6 +88,43 @@ class ScanResult:
     confidence: float = 0.0  # 0.0 to 1.0
 
 
+class _DirListing:
+    """
+    Directory listings cached for the duration of one scan.
+
+    Entry, interpreter and config detection all probe the same folders;
+    each folder is read with a single os.scandir() call and every later
+    existence check is answered from memory.
+    """
+
+    def __init__(self):
+        self._listings: dict[str, dict[str, os.DirEntry]] = {}
+
+    def entries(self, folder: Path) -> dict[str, os.DirEntry]:
+        """Get the entries of a folder, keyed by normalized name."""
+        key = str(folder)
+        listing = self._listings.get(key)
+        if listing is None:
+            try:
+                with os.scandir(folder) as it:
+                    listing = {os.path.normcase(e.name): e for e in it}
+            except OSError:
+                listing = {}
+            self._listings[key] = listing
+        return listing
+
+    def find(self, folder: Path, relative: str) -> Optional[os.DirEntry]:
+        """Find a relative path like "venv/Scripts/python.exe" under folder."""
+        *dirs, name = relative.split("/")
+        current = folder
+        for part in dirs:
+            entry = self.entries(current).get(os.path.normcase(part))
+            if entry is None or not entry.is_dir():
+                return None
+            current = Path(entry.path)
+        return self.entries(current).get(os.path.normcase(name))
+
+
 class ProjectScanner:
     """
     Smart project scanner that recursively finds entrypoints and interpreters.
@@ -94,6 +146,7 @@ class ProjectScanner:
         """
         folder_path = Path(folder)
         result = ScanResult()
+        listing = _DirListing()
 
         if not folder_path.exists():
             logger.warning(f"[Scanner] Folder does not exist: {folder}")
@@ -102,14 +155,14 @@ class ProjectScanner:
         logger.info(f"[Scanner] Scanning: {folder}")
 
         # Step 1: Try to detect from config files
-        config_result = self._scan_config_files(folder_path)
+        config_result = self._scan_config_files(folder_path, listing)
         if config_result.entrypoint:
             logger.info(f"[Scanner] Found entrypoint from config: {config_result.entrypoint}")
             result = config_result
 
         # Step 2: Check root folder for common patterns
         if not result.entrypoint:
-            root_entry = self._find_entry_in_folder(folder_path)
+            root_entry = self._find_entry_in_folder(folder_path, listing)
             if root_entry:
                 result.entrypoint = root_entry
                 result.confidence = 0.9
@@ -117,14 +170,14 @@ class ProjectScanner:
 
         # Step 3: Recursive search
         if not result.entrypoint:
-            recursive_entry = self._find_entry_recursive(folder_path)
+            recursive_entry = self._find_entry_recursive(folder_path, listing)
             if recursive_entry:
                 result.entrypoint = recursive_entry
                 result.confidence = 0.7
                 logger.info(f"[Scanner] Found entrypoint recursively: {recursive_entry}")
 
         # Step 4: Find interpreter
-        interpreter = self._find_interpreter(folder_path)
+        interpreter = self._find_interpreter(folder_path, listing)
         if interpreter:
             result.interpreter = interpreter
             logger.info(f"[Scanner] Found interpreter: {interpreter}")
@@ -135,13 +188,13 @@ class ProjectScanner:
 
         return result
 
-    def _scan_config_files(self, folder: Path) -> ScanResult:
+    def _scan_config_files(self, folder: Path, listing: _DirListing) -> ScanResult:
         """Check config files for entrypoint definitions."""
         result = ScanResult()
 
         # Check package.json (Node.js)
         package_json = folder / "package.json"
-        if package_json.exists():
+        if listing.find(folder, "package.json") is not None:
             try:
                 with open(package_json, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -156,7 +209,7 @@ class ProjectScanner:
 
         # Check pyproject.toml (Python)
         pyproject = folder / "pyproject.toml"
-        if pyproject.exists():
+        if listing.find(folder, "pyproject.toml") is not None:
             try:
                 content = pyproject.read_text(encoding="utf-8")
                 # Simple parsing - look for scripts section
@@ -169,98 +222,92 @@ class ProjectScanner:
 
         return result
 
-    def _find_entry_in_folder(self, folder: Path) -> Optional[str]:
+    def _find_entry_in_folder(self, folder: Path, listing: _DirListing) -> Optional[str]:
         """Find entry file in a specific folder (non-recursive)."""
+        entries = listing.entries(folder)
         for pattern in ENTRY_PATTERNS:
-            entry_path = folder / pattern
-            if entry_path.exists() and entry_path.is_file():
+            entry = entries.get(os.path.normcase(pattern))
+            if entry is not None and entry.is_file():
                 return pattern
         return None
 
-    def _find_entry_recursive(self, root: Path, current_depth: int = 0) -> Optional[str]:
+    def _find_entry_recursive(
+        self, root: Path, listing: _DirListing, current_depth: int = 0
+    ) -> Optional[str]:
         """Recursively search for entry files."""
         if current_depth >= self.max_depth:
             return None
 
-        try:
-            for item in root.iterdir():
-                if item.is_dir():
-                    # Skip excluded folders
-                    if item.name in SKIP_FOLDERS:
-                        continue
-                    if any(
-                        item.name.endswith(skip.replace("*", ""))
-                        for skip in SKIP_FOLDERS if "*" in skip
-                    ):
-                        continue
-
-                    # Check this subfolder
-                    entry = self._find_entry_in_folder(item)
-                    if entry:
-                        # Return relative path from project root
-                        return str(Path(item.name) / entry)
-
-                    # Go deeper
-                    deeper = self._find_entry_recursive(item, current_depth + 1)
-                    if deeper:
-                        return str(Path(item.name) / deeper)
-        except PermissionError:
-            pass
+        for entry in listing.entries(root).values():
+            if entry.is_dir():
+                # Skip excluded folders
+                if entry.name in SKIP_FOLDERS:
+                    continue
+                if any(
+                    entry.name.endswith(skip.replace("*", ""))
+                    for skip in SKIP_FOLDERS if "*" in skip
+                ):
+                    continue
+
+                item = Path(entry.path)
+
+                # Check this subfolder
+                found = self._find_entry_in_folder(item, listing)
+                if found:
+                    # Return relative path from project root
+                    return str(Path(entry.name) / found)
+
+                # Go deeper
+                deeper = self._find_entry_recursive(item, listing, current_depth + 1)
+                if deeper:
+                    return str(Path(entry.name) / deeper)
 
         return None
 
-    def _find_interpreter(self, folder: Path) -> Optional[str]:
+    def _find_interpreter(self, folder: Path, listing: _DirListing) -> Optional[str]:
         """Find Python interpreter, checking recursively for venvs."""
         # First check standard locations in project root
         for venv_path in VENV_INTERPRETER_PATHS:
-            interpreter = folder / venv_path
-            if interpreter.exists():
-                return str(interpreter.resolve())
+            if listing.find(folder, venv_path) is not None:
+                return str((folder / venv_path).resolve())
 
         # Recursive search for venv in subdirectories
-        return self._find_interpreter_recursive(folder, 0)
+        return self._find_interpreter_recursive(folder, listing, 0)
 
-    def _find_interpreter_recursive(self, folder: Path, depth: int) -> Optional[str]:
+    def _find_interpreter_recursive(
+        self, folder: Path, listing: _DirListing, depth: int
+    ) -> Optional[str]:
         """Recursively search for virtual environments."""
         if depth >= self.max_depth:
             return None
 
-        try:
-            for item in folder.iterdir():
-                if item.is_dir():
-                    # Skip non-venv folders
-                    if (item.name in SKIP_FOLDERS
-                            and item.name not in {".venv", "venv", "env", ".env"}):
-                        continue
-
-                    # Check if this folder is a venv
-                    python_exe = item / "Scripts" / "python.exe"
-                    if python_exe.exists():
-                        return str(python_exe.resolve())
-
-                    # Check subfolders (but not too deep)
-                    if item.name not in {".git", "node_modules", "__pycache__"}:
-                        result = self._find_interpreter_recursive(item, depth + 1)
-                        if result:
-                            return result
-        except PermissionError:
-            pass
+        for entry in listing.entries(folder).values():
+            if entry.is_dir():
+                # Skip non-venv folders
+                if (entry.name in SKIP_FOLDERS
+                        and entry.name not in {".venv", "venv", "env", ".env"}):
+                    continue
+
+                item = Path(entry.path)
+
+                # Check if this folder is a venv
+                if listing.find(item, "Scripts/python.exe") is not None:
+                    return str((item / "Scripts" / "python.exe").resolve())
+
+                # Check subfolders (but not too deep)
+                if entry.name not in {".git", "node_modules", "__pycache__"}:
+                    result = self._find_interpreter_recursive(item, listing, depth + 1)
+                    if result:
+                        return result
 
         return None
 
     def _detect_language(self, entrypoint: str) -> Optional[str]:
         """Detect programming language from entrypoint file extension."""
-        ext = Path(entrypoint).suffix.lower()
-        language_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".go": "go",
-            ".php": "php",
-            ".rb": "ruby",
-            ".java": "java",
-        }
-        return language_map.get(ext)
+        idx = entrypoint.rfind(".")
+        if idx < 0:
+            return None
+        return LANGUAGE_BY_EXT.get(entrypoint[idx + 1:].lower())
 
 
 def get_all_script_files(folder: str, max_depth: int = 3) -> list[str]:
@@ -268,25 +315,26 @@ def get_all_script_files(folder: str, max_depth: int = 3) -> list[str]:
     Get all executable script files in a project folder.
     Returns relative paths from the project root.
     """
-    folder_path = Path(folder)
     scripts = []
 
-    def scan_folder(path: Path, depth: int, prefix: str = ""):
+    def scan_folder(path: str, depth: int, prefix: str = ""):
         if depth > max_depth:
             return
 
         try:
-            for item in sorted(path.iterdir()):
-                if item.is_file():
+            # scandir entries carry their file type, so is_file()/is_dir() need no extra stat()
+            with os.scandir(path) as it:
+                # Same order as sorting Path objects (case-insensitive on Windows)
+                entries = sorted(it, key=lambda e: os.path.normcase(e.name))
+            for entry in entries:
+                if entry.is_file():
                     # Check if it's a known script type
-                    if item.suffix.lower() in {".py", ".js", ".ts", ".go", ".php", ".rb"}:
-                        rel_path = f"{prefix}{item.name}" if prefix else item.name
-                        scripts.append(rel_path)
-                elif item.is_dir() and item.name not in SKIP_FOLDERS:
-                    new_prefix = f"{prefix}{item.name}/" if prefix else f"{item.name}/"
-                    scan_folder(item, depth + 1, new_prefix)
+                    if os.path.splitext(entry.name)[1].lower() in SCRIPT_EXTENSIONS:
+                        scripts.append(f"{prefix}{entry.name}")
+                elif entry.is_dir() and entry.name not in SKIP_FOLDERS:
+                    scan_folder(entry.path, depth + 1, f"{prefix}{entry.name}/")
         except PermissionError:
             pass
 
-    scan_folder(folder_path, 0)
+    scan_folder(folder, 0)
     return scripts
@@ -10,6 +10,7 @@ from hamal.database.models import Base
 # Global engine and session factory
 ENGINE = None
 SESSION_LOCAL = None
+_INITIALIZED = False
 
 
 def get_engine():
@@ -35,9 +36,16 @@ def get_session_factory() -> sessionmaker:
 
 
 def init_database():
-    """Initialize the database, creating tables if they don't exist."""
+    """Initialize the database, creating tables if they don't exist.
+
+    Safe to call more than once; the schema check only runs on the first call.
+    """
+    global _INITIALIZED  # pylint: disable=global-statement
+    if _INITIALIZED:
+        return
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    _INITIALIZED = True
 
 
 def get_session() -> Session:
@@ -3,11 +3,15 @@
 import customtkinter as ctk
 
 from hamal.database.database import init_database
+from hamal.ui.icons import Icons
 from hamal.ui.main_window import MainWindow
 
 
 def main():
     """Main entry point for H.A.M.A.L."""
+    # Decode icons in the background while the database and window are set up
+    Icons.load_async()
+
     # Initialize database
     init_database()
 
@@ -1,7 +1,47 @@
 """About dialog window."""
 
 import customtkinter as ctk
+from PIL import Image  # Already loaded by customtkinter, so no startup cost
+
 from hamal.core.config import APP_NAME, APP_VERSION
+from hamal.ui.icons import get_icons_dir
+
+# Fixed dialog size (width, height)
+DIALOG_SIZE = (400, 450)
+
+# Logo is displayed at this size; icon_100.png is pre-rendered to match it
+LOGO_SIZE = (100, 100)
+
+# Logo source, pre-rendered at LOGO_SIZE and resolved once at import
+_ICON_PATH = get_icons_dir() / "icon_100.png"
+
+# Logo image shared by every AboutDialog (loaded on first use)
+_LOGO_CACHE: ctk.CTkImage | None = None
+
+
+def _load_logo_pixels():
+    """Load the logo, which is shipped already scaled to LOGO_SIZE."""
+    if not _ICON_PATH.exists():
+        return None
+    pil_img = Image.open(_ICON_PATH)
+    pil_img.load()  # Decode now so the file handle isn't kept open
+    return pil_img
+
+
+def _get_logo_image() -> ctk.CTkImage | None:
+    """Load the About logo once and reuse it for later dialogs."""
+    global _LOGO_CACHE  # pylint: disable=global-statement
+    if _LOGO_CACHE is None:
+        pil_img = _load_logo_pixels()
+        if pil_img is None:
+            return None
+        _LOGO_CACHE = ctk.CTkImage(
+            light_image=pil_img,
+            dark_image=pil_img,
+            size=LOGO_SIZE
+        )
+    return _LOGO_CACHE
+
 
 class AboutDialog(ctk.CTkToplevel):
     """Dialog displaying application information."""
@@ -9,39 +49,32 @@ class AboutDialog(ctk.CTkToplevel):
         super().__init__(parent)
 
         self.title(f"About {APP_NAME}")
-        self.geometry("400x450")
         self.resizable(False, False)
-        # Center the window
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"+{x}+{y}")
-        # Make it modal
+        # Size and center in one step from the known dimensions; querying
+        # winfo_width() would need an update_idletasks() layout pass first
+        self._center_on_screen(*DIALOG_SIZE)
         self.transient(parent)
+        self._setup_ui()
+        # Make it modal once the widgets exist
         self.grab_set()
         self.focus_force()
-        self._setup_ui()
+
+    def _center_on_screen(self, width: int, height: int):
+        """Place the window centered on screen without forcing a layout pass."""
+        # Sizes passed to geometry() are scaled by CTk, positions are not
+        scaling = ctk.ScalingTracker.get_window_scaling(self)
+        x = (self.winfo_screenwidth() - round(width * scaling)) // 2
+        y = (self.winfo_screenheight() - round(height * scaling)) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
+
     def _setup_ui(self):
         # Main container
         self.grid_columnconfigure(0, weight=1)
 
         # Logo
-        from PIL import Image  # pylint: disable=import-outside-toplevel
-        from hamal.ui.icons import get_icons_dir  # pylint: disable=import-outside-toplevel
-
         try:
-            # Use specific size icon for best quality
-            img_path = get_icons_dir() / "icon_128.png"
-            if img_path.exists():
-                pil_img = Image.open(img_path)
-                large_logo = ctk.CTkImage(
-                    light_image=pil_img,
-                    dark_image=pil_img,
-                    size=(100, 100)
-                )
-
+            large_logo = _get_logo_image()
+            if large_logo is not None:
                 logo_label = ctk.CTkLabel(
                     self,
                     text="",
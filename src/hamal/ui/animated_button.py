@@ -1,10 +1,185 @@
 """Animated button with 3D depth effect using generated images for pixel-perfect rendering."""
 
+import functools
 from typing import Callable, Optional
 
 import customtkinter as ctk
 from PIL import Image, ImageDraw, ImageFont
 
+
+# Parsed fonts shared by every button in the process, keyed by (file name, size)
+_FONT_CACHE: dict[tuple[str, int], ImageFont.ImageFont] = {}
+
+
+def _get_font(name: str, size: int):
+    """Load a TrueType font once per (name, size), falling back to PIL's default font."""
+    key = (name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = ImageFont.truetype(name, size)
+        except IOError:
+            font = ImageFont.load_default()
+        _FONT_CACHE[key] = font
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _brightness_table(factor: float) -> bytes:
+    """Byte translation table mapping each channel value c to int(c * factor)."""
+    return bytes(min(int(c * factor), 255) for c in range(256))
+
+
+@functools.lru_cache(maxsize=256)
+def _adjust_brightness(hex_color: str, factor: float) -> str:
+    """Scale all channels of a '#rrggbb' color by factor in one bytes.translate pass."""
+    rgb = bytes.fromhex(hex_color.lstrip('#'))
+    return "#" + rgb.translate(_brightness_table(factor)).hex()
+
+
+_RESAMPLE = getattr(Image, 'Resampling', Image).LANCZOS
+_TRANSPOSE = getattr(Image, 'Transpose', Image)
+
+# Only the corner tiles are supersampled; everything else is drawn at final size
+_CORNER_SUPERSAMPLE = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _corner_mask(radius: int) -> Image.Image:
+    """Anti-aliased alpha mask for a top-left rounded corner."""
+    big = radius * _CORNER_SUPERSAMPLE
+    tile = Image.new("L", (big, big), 0)
+    ImageDraw.Draw(tile).pieslice((0, 0, big * 2 - 1, big * 2 - 1), 180, 270, fill=255)
+    return tile.resize((radius, radius), _RESAMPLE)
+
+
+@functools.lru_cache(maxsize=None)
+def _rounded_rect_mask(width: int, height: int, radius: int) -> Image.Image:
+    """Alpha mask for a rounded rectangle, built from one corner tile."""
+    mask = Image.new("L", (width, height), 255)
+    corner = _corner_mask(radius)
+    mask.paste(corner, (0, 0))
+    mask.paste(corner.transpose(_TRANSPOSE.FLIP_LEFT_RIGHT), (width - radius, 0))
+    mask.paste(corner.transpose(_TRANSPOSE.FLIP_TOP_BOTTOM), (0, height - radius))
+    mask.paste(corner.transpose(_TRANSPOSE.ROTATE_180), (width - radius, height - radius))
+    return mask
+
+
+def _draw_rounded_rect(img: Image.Image, xy: tuple[int, int], size: tuple[int, int],
+                       radius: int, color: str):
+    """Alpha-composite a filled, anti-aliased rounded rectangle onto img."""
+    layer = Image.new("RGBA", size, color)
+    layer.putalpha(_rounded_rect_mask(size[0], size[1], radius))
+    img.alpha_composite(layer, dest=xy)
+
+
+@functools.lru_cache(maxsize=None)
+def _tinted_icon(icon: ctk.CTkImage, height: int) -> Optional[Image.Image]:
+    """Icon resized to the given height and recolored to the text color (#1e1e2e)."""
+    # Extract PIL image from CTkImage (dark_image if set, else light_image)
+    # CTkImage stores PIL images in _dark_image/_light_image
+    original_icon = icon._dark_image or icon._light_image  # pylint: disable=protected-access
+    if not original_icon:
+        return None
+
+    aspect = original_icon.width / original_icon.height
+    icon_img = original_icon.resize((int(height * aspect), height), _RESAMPLE)
+    if icon_img.mode != 'RGBA':
+        icon_img = icon_img.convert('RGBA')
+
+    # Solid text color that keeps the icon's own alpha - no compositing needed
+    tinted = Image.new('RGBA', icon_img.size, "#1e1e2e")
+    tinted.putalpha(icon_img.getchannel('A'))
+    return tinted
+
+
+@functools.lru_cache(maxsize=64)
+def _render_skin(
+    base_color: str,
+    hover_color: str,
+    pressed_color: str,
+    shadow_color: str,
+    size: tuple[int, int],
+    corner_radius: int,
+    shadow_offset: int,
+    press_offset: int = 2,
+) -> tuple[Image.Image, Image.Image, Image.Image]:
+    """
+    Render the (normal, hover, pressed) shadow + face backgrounds for one color scheme.
+    Buttons sharing a scheme share these; text and icon are painted on copies.
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    width, height = size
+    canvas_size = (width + shadow_offset, height + shadow_offset)
+
+    def skin(face_color: str, face_off: int) -> Image.Image:
+        # Transparent canvas at the final size (no supersample + downscale pass)
+        img = Image.new("RGBA", canvas_size, (0, 0, 0, 0))
+        _draw_rounded_rect(img, (shadow_offset, shadow_offset), size, corner_radius, shadow_color)
+        _draw_rounded_rect(img, (face_off, face_off), size, corner_radius, face_color)
+        return img
+
+    # Pressed: darker face moved down-right towards the shadow
+    return skin(base_color, 0), skin(hover_color, 0), skin(pressed_color, press_offset)
+
+
+def _paint_content(
+    skin: Image.Image,
+    text: str,
+    icon: Optional[ctk.CTkImage],
+    size: tuple[int, int],
+    face_offset: int = 0,
+) -> ctk.CTkImage:
+    """Paint centered icon + text onto a copy of a skin and wrap it as a CTkImage."""
+    # pylint: disable=too-many-locals
+    width, height = size
+    img = skin.copy()
+    draw = ImageDraw.Draw(img)
+    font_size = 13
+    font = _get_font("arialbd.ttf", font_size)
+
+    # Measure text (unused text_h removed implicitly by just extracting text_w)
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_w = bbox[2] - bbox[0]
+
+    # Icon dimensions
+    icon_size = 0
+    gap = 8  # Gap between icon and text
+    icon_img = None
+
+    if icon:
+        # Resize icon to fit text height roughly (slightly larger than text)
+        icon_img = _tinted_icon(icon, font_size + 4)
+        if icon_img:
+            icon_size = icon_img.width
+
+    # Calculate total content width
+    total_w = text_w
+    if icon_img:
+        total_w += icon_size + gap
+
+    # Center content on the face
+    start_x = face_offset + (width - total_w) / 2
+    center_y = face_offset + height / 2
+
+    # Draw Icon
+    current_x = start_x
+    if icon_img:
+        icon_y = int(center_y - icon_img.height / 2)
+        img.paste(icon_img, (int(current_x), int(icon_y)), icon_img)
+        current_x += icon_size + gap
+
+    # Draw Text
+    # text anchor 'lm' = left middle
+    draw.text((current_x, center_y), text, fill="#1e1e2e", font=font, anchor="lm")
+
+    return ctk.CTkImage(
+        light_image=img,
+        dark_image=img,
+        size=img.size
+    )
+
+
 class DepthButton(ctk.CTkLabel):
     """
     Button that renders itself fully as an image using PIL.
@@ -12,6 +187,10 @@ class DepthButton(ctk.CTkLabel):
     """
     # pylint: disable=too-many-ancestors,too-many-instance-attributes
 
+    # (normal, hover, pressed) images shared by buttons that look identical.
+    # Keyed by the icon object itself, which also keeps it alive while cached.
+    _image_cache: dict[tuple, tuple[ctk.CTkImage, ctk.CTkImage, ctk.CTkImage]] = {}
+
     def __init__(
         self,
         master,
@@ -42,6 +221,7 @@ class DepthButton(ctk.CTkLabel):
         # Design constants
         self._shadow_offset = 3
         self._corner_radius = 11  # Matches the design
+        self._press_offset = 2
 
         # Canvas size needs to accommodate the offset
         self._img_width = width + self._shadow_offset
@@ -49,12 +229,8 @@ class DepthButton(ctk.CTkLabel):
 
         # Generate images for states
         # Pre-generating ensures smooth performance
-        self._img_normal = self._generate_image(base_color, offset_y=0, is_pressed=False)
-        self._img_hover = self._generate_image(hover_color, offset_y=0, is_pressed=False)
-
-        # Pressed: darkens color + moves content/face down-right
-        pressed_color = self._adjust_brightness(base_color, 0.9)
-        self._img_pressed = self._generate_image(pressed_color, offset_y=2, is_pressed=True)
+        self._img_normal, self._img_hover, self._img_pressed = self._get_or_build_images()
+        self._shown_image = self._img_normal
 
         # Initialize as a Label that displays the image
         super().__init__(
@@ -74,146 +250,52 @@ class DepthButton(ctk.CTkLabel):
         self.bind("<Button-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
 
-    def _generate_image(self, face_color, offset_y=0, is_pressed=False):
-        """Generates a high-quality CTkImage for a specific state."""
-        # pylint: disable=too-many-locals,too-many-statements
-        scale = 3 # 3x scale for super smooth anti-aliasing
-        w = self._img_width * scale
-        h = self._img_height * scale
-        r = self._corner_radius * scale
-
-        shadow_off_x = self._shadow_offset * scale
-        shadow_off_y = self._shadow_offset * scale
-
-        # Calculate Face Position
-        press_off = (offset_y * scale) if is_pressed else 0
-        face_x = press_off
-        face_y = press_off
-
-        # Create transparent canvas
-        img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # 1. Draw Shadow
-        shadow_rect = [
-            shadow_off_x,
-            shadow_off_y,
-            shadow_off_x + (self._width * scale),
-            shadow_off_y + (self._height * scale)
-        ]
-        draw.rounded_rectangle(shadow_rect, radius=r, fill=self._shadow_color)
-
-        # 2. Draw Face
-        face_rect = [
-            face_x,
-            face_y,
-            face_x + (self._width * scale),
-            face_y + (self._height * scale)
-        ]
-        draw.rounded_rectangle(face_rect, radius=r, fill=face_color)
-
-        # 3. Content (Icon + Text)
-        # Load font
-        font_size = 13 * scale
-        try:
-            font = ImageFont.truetype("arialbd.ttf", font_size)
-        except IOError:
-            font = ImageFont.load_default()
-
-        # Measure text (unused text_h removed implicitly by just extracting text_w)
-        bbox = draw.textbbox((0, 0), self._text_str, font=font)
-        text_w = bbox[2] - bbox[0]
-
-        # Icon dimensions
-        icon_size = 0
-        gap = 8 * scale  # Gap between icon and text
-        icon_img = None
-
-        if self._icon:
-            # Extract PIL image from CTkImage (use dark_image as source)
-            # CTkImage stores PIL images in _dark_image/_light_image
-            original_icon = self._icon._dark_image  # pylint: disable=protected-access
-            if original_icon:
-                # Resize icon to fit text height roughly (or fixed size 16-20px)
-                target_icon_h = font_size + (4 * scale) # Slightly larger than text
-                aspect = original_icon.width / original_icon.height
-                icon_w = int(target_icon_h * aspect)
-                icon_h = int(target_icon_h)
-
-                resample_filter = getattr(Image, 'Resampling', Image).LANCZOS
-                icon_img = original_icon.resize((icon_w, icon_h), resample_filter)
-
-                # Recolor icon to text color (#1e1e2e)
-                # This assumes icon has transparency. We use alpha as mask for solid color.
-                if icon_img.mode != 'RGBA':
-                    icon_img = icon_img.convert('RGBA')
-
-                # Create a solid color image
-                solid_color = Image.new('RGBA', icon_img.size, "#1e1e2e")
-                # Composite: use icon's alpha channel as mask
-                icon_img = Image.composite(
-                    solid_color,
-                    Image.new('RGBA', icon_img.size, (0,0,0,0)),
-                    icon_img
-                )
-
-                icon_size = icon_w
-
-        # Calculate total content width
-        total_w = text_w
-        if icon_img:
-            total_w += icon_size + gap
-
-        # Center content
-        face_w = face_rect[2] - face_rect[0]
-        face_h = face_rect[3] - face_rect[1]
-
-        start_x = face_rect[0] + (face_w - total_w) / 2
-        center_y = face_rect[1] + (face_h) / 2
-
-        # Draw Icon
-        current_x = start_x
-        if icon_img:
-            icon_y = int(center_y - icon_img.height / 2)
-            img.paste(icon_img, (int(current_x), int(icon_y)), icon_img)
-            current_x += icon_size + gap
-
-        # Draw Text
-        # text anchor 'lm' = left middle
-        draw.text((current_x, center_y), self._text_str, fill="#1e1e2e", font=font, anchor="lm")
-
-        # Downscale
-        resample_filter = getattr(Image, 'Resampling', Image).LANCZOS
-        img = img.resize((self._img_width, self._img_height), resample_filter)
-
-        return ctk.CTkImage(
-            light_image=img,
-            dark_image=img,
-            size=(self._img_width, self._img_height)
+    def _get_or_build_images(self) -> tuple[ctk.CTkImage, ctk.CTkImage, ctk.CTkImage]:
+        """Return the (normal, hover, pressed) images, rendering them only on a cache miss."""
+        key = (
+            self._text_str, self._base_color, self._hover_color, self._shadow_color,
+            self._width, self._height, self._icon
         )
-
-    def _adjust_brightness(self, hex_color, factor):
-        if hex_color.startswith("#"):
-            hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        new_rgb = tuple(int(c * factor) for c in rgb)
-        return f"#{new_rgb[0]:02x}{new_rgb[1]:02x}{new_rgb[2]:02x}"
+        images = self._image_cache.get(key)
+        if images is None:
+            # Pressed: darkens color + moves content/face down-right
+            pressed_color = _adjust_brightness(self._base_color, 0.9)
+            size = (self._width, self._height)
+            skins = _render_skin(
+                self._base_color, self._hover_color, pressed_color, self._shadow_color,
+                size, self._corner_radius, self._shadow_offset, self._press_offset,
+            )
+            images = (
+                _paint_content(skins[0], self._text_str, self._icon, size),
+                _paint_content(skins[1], self._text_str, self._icon, size),
+                _paint_content(skins[2], self._text_str, self._icon, size, self._press_offset),
+            )
+            self._image_cache[key] = images
+        return images
+
+    def _show_image(self, image: ctk.CTkImage):
+        """Swap to a pre-rendered state image, skipping no-op swaps."""
+        # Enter/Leave fire repeatedly while the pointer crosses child widgets;
+        # re-configuring the same image would still re-layout the label.
+        if image is not self._shown_image:
+            self._shown_image = image
+            self.configure(image=image)
 
     def _on_enter(self, _event):
         if self._is_enabled:
-            self.configure(image=self._img_hover)
+            self._show_image(self._img_hover)
 
     def _on_leave(self, _event):
         if self._is_enabled:
-            self.configure(image=self._img_normal)
+            self._show_image(self._img_normal)
 
     def _on_press(self, _event):
         if self._is_enabled:
-            self.configure(image=self._img_pressed)
+            self._show_image(self._img_pressed)
 
     def _on_release(self, _event):
         if self._is_enabled:
-            self.configure(image=self._img_hover)
+            self._show_image(self._img_hover)
             # Invoke command
             if self._command:
                 self._command()
@@ -242,10 +324,7 @@ def create_depth_button(
     """Create a button with 3D depth effect."""
     # pylint: disable=too-many-locals,too-many-arguments,too-many-positional-arguments
     if shadow_color is None:
-        hex_color = base_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        r, g, b = int(r * 0.6), int(g * 0.6), int(b * 0.6)
-        shadow_color = f"#{r:02x}{g:02x}{b:02x}"
+        shadow_color = _adjust_brightness(base_color, 0.6)
 
     return DepthButton(
         master,
@@ -1,6 +1,7 @@
 
 """Dashboard widget with project table using CustomTkinter."""
 
+import time
 from tkinter import messagebox
 from typing import Callable, Optional
 
@@ -30,6 +31,32 @@ COLORS = {
     "mauve": "#cba6f7",
 }
 
+# Status label color, text and whether uptime is shown, per process status
+_STATUS_CONFIG: dict[ProcessStatus, tuple[str, str, bool]] = {
+    ProcessStatus.STOPPED: (COLORS["subtext"], "● Stopped", False),
+    ProcessStatus.STARTING: (COLORS["yellow"], "● Starting...", False),
+    ProcessStatus.RUNNING: (COLORS["green"], "● Running", True),
+    ProcessStatus.STOPPING: (COLORS["yellow"], "● Stopping...", False),
+    ProcessStatus.CRASHED: (COLORS["red"], "● Crashed", False),
+}
+_UNKNOWN_STATUS = (COLORS["subtext"], "● Unknown", False)
+
+# Bind tags shared by all project rows: hover highlight, and click-to-open-logs
+ROW_TAG = "HamalRow"
+ROW_CLICK_TAG = "HamalRowClick"
+# Bind tag of the row action buttons; the button's row_action attribute names the action
+ROW_ACTION_TAG = "HamalRowAction"
+
+# Rows created per event-loop turn when many projects are added at once
+ROW_BATCH_SIZE = 25
+
+
+def _add_bindtag(widget, tags: tuple[str, ...]):
+    """Prepend bind tags to a widget and all of its descendants."""
+    widget.bindtags(tags + widget.bindtags())
+    for child in widget.winfo_children():
+        _add_bindtag(child, tags)
+
 
 class Dashboard(ctk.CTkFrame):
     """Main dashboard with project table and controls."""
@@ -47,10 +74,28 @@ class Dashboard(ctk.CTkFrame):
         self.process_manager = process_manager
         self.on_view_logs = on_view_logs
         self.project_rows: dict[int, dict] = {}  # project_id -> row widgets
+        # Status pushed by ProcessManager callbacks; rows are never polled for it
+        self._status_cache: dict[int, ProcessStatus] = {}
+        # project_id -> time.monotonic() at which the project was seen running
+        self._run_started: dict[int, float] = {}
+        # project_id -> uptime text currently shown in the row
+        self._last_uptime_text: dict[int, str] = {}
+        # project_id -> (name, entrypoint, interpreter_path) last shown in the row
+        self._project_snapshot: dict[int, tuple] = {}
         self.active_log_project_id: Optional[int] = None  # Track which project's logs are open
-
-        # Ensure icons are loaded
+        self._refresh_pending = False  # A refresh is queued via after_idle
+        self._project_count = 0
+        self._empty_shown = False  # Whether empty_label is currently gridded
+        # (row index, project, uptime) for rows not created yet, and the job creating them
+        self._pending_rows: list[tuple[int, Project, Optional[float]]] = []
+        self._materialize_job: Optional[str] = None
+        self._row_paths: dict[str, int] = {}  # Row frame Tk path -> project_id
+
+        # Ensure icons are loaded, and keep the ones used here for row creation
         Icons.load()
+        self._ico = {
+            name: Icons.get(name) for name in ("play", "stop", "plus", "settings", "trash")
+        }
 
         self._setup_ui()
         self._refresh_projects()
@@ -60,6 +105,13 @@ class Dashboard(ctk.CTkFrame):
 
     def _setup_ui(self):
         """Setup the dashboard UI."""
+        # Fonts are shared by every row (each CTkFont is a named Tk font)
+        self._font_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_header = ctk.CTkFont(size=12, weight="bold")
+        self._font_row_name = ctk.CTkFont(size=13)
+        self._font_row = ctk.CTkFont(size=12)
+        self._font_empty = ctk.CTkFont(size=14)
+
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
@@ -73,7 +125,7 @@ class Dashboard(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             self.header,
             text="Projects",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=self._font_title,
             text_color=COLORS["text"]
         )
         self.title.grid(row=0, column=0, sticky="w", padx=5)
@@ -90,7 +142,7 @@ class Dashboard(ctk.CTkFrame):
             text="Start All",
             base_color=COLORS["green"],
             hover_color="#b8efb3",  # Lighter green for hover
-            image=Icons.get("play"),
+            image=self._ico["play"],
             command=self._on_start_all,
             width=110,
             bg_color=COLORS["base"]  # Match window background to fix corner artifacts
@@ -103,7 +155,7 @@ class Dashboard(ctk.CTkFrame):
             text="Add Project",
             base_color=COLORS["blue"],
             hover_color="#9bc4ff",  # Lighter blue for hover
-            image=Icons.get("plus"),
+            image=self._ico["plus"],
             command=self._on_add_project,
             width=130,
             bg_color=COLORS["base"]
@@ -116,7 +168,7 @@ class Dashboard(ctk.CTkFrame):
             text="Stop All",
             base_color=COLORS["red"],
             hover_color="#ff9fb8",  # Lighter red for hover
-            image=Icons.get("stop"),
+            image=self._ico["stop"],
             command=self._on_stop_all,
             width=110,
             bg_color=COLORS["base"]
@@ -144,7 +196,7 @@ class Dashboard(ctk.CTkFrame):
             lbl = ctk.CTkLabel(
                 self.table_header,
                 text=text,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font_header,
                 text_color=COLORS["subtext"],
                 width=width,
                 anchor="w" if i == 0 else "center"
@@ -163,38 +215,114 @@ class Dashboard(ctk.CTkFrame):
         self.table_body.grid(row=1, column=0, sticky="nsew", padx=2, pady=2)
         self.table_body.grid_columnconfigure(0, weight=1)
 
+        # One set of handlers serves every row (rows carry the tags via bindtags)
+        self.bind_class(ROW_TAG, "<Enter>", self._on_row_enter)
+        self.bind_class(ROW_TAG, "<Leave>", self._on_row_leave)
+        self.bind_class(ROW_CLICK_TAG, "<Button-1>", self._on_row_click)
+        self.bind_class(ROW_ACTION_TAG, "<ButtonRelease-1>", self._on_row_action)
+
         # Empty state
         self.empty_label = ctk.CTkLabel(
             self.table_body,
             text="No projects yet.\nClick '+ Add Project' to get started!",
-            font=ctk.CTkFont(size=14),
+            font=self._font_empty,
             text_color=COLORS["subtext"]
         )
 
-    def _refresh_projects(self):
-        """Refresh the project list from database."""
-        # Clear existing rows
-        for row_widgets in self.project_rows.values():
-            row_widgets["frame"].destroy()
-        self.project_rows.clear()
+    def _schedule_refresh(self):
+        """Refresh the project list once the event loop is idle, coalescing repeated requests."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
 
-        # Get projects
-        projects = get_all_projects()
+    def _do_refresh(self):
+        """Run a scheduled refresh."""
+        self._refresh_pending = False
+        self._refresh_projects()
 
+    def _refresh_projects(self):
+        """Sync the project rows with the database, touching only rows that changed."""
+        projects = get_all_projects()
+        new_ids = {project.id: project for project in projects}
+        self._project_count = len(projects)
+
+        # Pending rows are re-derived below from the fresh project list
+        if self._materialize_job is not None:
+            self.after_cancel(self._materialize_job)
+            self._materialize_job = None
+        self._pending_rows.clear()
+
+        # Forget deleted projects (including ones whose row wasn't created yet)
+        for project_id in set(self._status_cache) - new_ids.keys():
+            row = self.project_rows.pop(project_id, None)
+            if row is not None:
+                self._row_paths.pop(str(row["frame"]), None)
+                row["frame"].destroy()
+            self._project_snapshot.pop(project_id, None)
+            self._last_uptime_text.pop(project_id, None)
+            self._status_cache.pop(project_id, None)
+            self._run_started.pop(project_id, None)
+            if self.active_log_project_id == project_id:
+                self.active_log_project_id = None
+
+        # Only touch the empty-state label when it has to appear or disappear
         if not projects:
-            self.empty_label.grid(row=0, column=0, pady=50)
+            if not self._empty_shown:
+                self._empty_shown = True
+                self.empty_label.grid(row=0, column=0, pady=50)
             return
 
-        self.empty_label.grid_forget()
+        if self._empty_shown:
+            self._empty_shown = False
+            self.empty_label.grid_forget()
 
-        # Create rows
-        for i, project in enumerate(projects):
-            self._create_project_row(i, project)
+        # New rows are seeded from one bulk status snapshot
+        statuses = None
+        if new_ids.keys() - self.project_rows.keys():
+            statuses = self.process_manager.get_all_statuses()
 
-    def _create_project_row(self, row_index: int, project: Project):
+        # Rows follow the database order (by name), so a rename can move a row
+        for i, project in enumerate(projects):
+            row = self.project_rows.get(project.id)
+            if row is None:
+                status, uptime = statuses.get(project.id, (ProcessStatus.STOPPED, None))
+                self._status_cache[project.id] = status
+                self._pending_rows.append((i, project, uptime))
+                continue
+
+            row["project"] = project
+            snapshot = (project.name, project.entrypoint, project.interpreter_path)
+            previous = self._project_snapshot.get(project.id)
+            if previous != snapshot:
+                self._project_snapshot[project.id] = snapshot
+                # Only the name is displayed; other fields just refresh the stored project
+                if previous is None or previous[0] != project.name:
+                    row["name"].configure(text=project.name)
+            if row["index"] != i:
+                row["index"] = i
+                row["frame"].grid_configure(row=i)
+
+        self._materialize_rows()
+
+    def _materialize_rows(self):
+        """Create the next batch of pending rows; the rest follow on later event-loop turns."""
+        self._materialize_job = None
+        batch = self._pending_rows[:ROW_BATCH_SIZE]
+        del self._pending_rows[:ROW_BATCH_SIZE]
+        for row_index, project, uptime in batch:
+            # Status may have changed since the refresh; the cache has the latest
+            self._create_project_row(row_index, project, self._status_cache[project.id], uptime)
+
+        # Yield to the event loop between batches so large lists don't freeze the UI
+        if self._pending_rows:
+            self._materialize_job = self.after(10, self._materialize_rows)
+
+    def _create_project_row(
+        self, row_index: int, project: Project,
+        status: ProcessStatus, uptime: Optional[float]
+    ):
         """Create a single project row."""
         # pylint: disable=too-many-locals,too-many-statements
-        status = self.process_manager.get_status(project.id)
 
         # Row frame
         row_frame = ctk.CTkFrame(
@@ -204,29 +332,13 @@ class Dashboard(ctk.CTkFrame):
         row_frame.grid(row=row_index, column=0, sticky="ew", pady=1)
         row_frame.grid_columnconfigure(0, weight=1)
 
-        # Define click handler with visual feedback
-        def on_click_visual(_event=None):
-            if (self.active_log_project_id is not None
-                    and self.active_log_project_id in self.project_rows):
-                old_row = self.project_rows[self.active_log_project_id]["frame"]
-                old_row.configure(border_color=COLORS["surface"])
-
-            # Set this project as active
-            self.active_log_project_id = project.id
-
-            # Show border
-            row_frame.configure(border_color=COLORS["blue"])
-            # Open logs
-            self.on_view_logs(project.id, project.name)
-
-
-        row_frame.bind("<Button-1>", on_click_visual)
+        project_id = project.id
 
         # Project name
         name_label = ctk.CTkLabel(
             row_frame,
             text=project.name,
-            font=ctk.CTkFont(size=13),
+            font=self._font_row_name,
             text_color=COLORS["text"],
             width=180,
             anchor="w",
@@ -234,33 +346,27 @@ class Dashboard(ctk.CTkFrame):
         )
         name_label.grid(row=0, column=0, padx=10, pady=8, sticky="w")
 
-        # Status with dot
-        status_frame = ctk.CTkFrame(row_frame, fg_color="transparent", width=100, cursor="hand2")
-        status_frame.grid(row=0, column=1, padx=10, pady=8)
-
-        status_dot = ctk.CTkLabel(
-            status_frame,
-            text="●",
-            font=ctk.CTkFont(size=10),
-            width=15,
-            cursor="hand2"
-        )
-        status_dot.pack(side="left")
+        # Label texts are bound to variables: .set() is a single Tcl call,
+        # while CTkLabel.configure() re-processes its options every time
+        status_var = ctk.StringVar(value="● Stopped")
+        uptime_var = ctk.StringVar(value="-")
 
-        status_text = ctk.CTkLabel(
-            status_frame,
-            text="Stopped",
-            font=ctk.CTkFont(size=12),
+        # Status: dot and text share one label so each row needs fewer widgets
+        status_label = ctk.CTkLabel(
+            row_frame,
+            textvariable=status_var,
+            font=self._font_row,
             text_color=COLORS["subtext"],
+            width=100,
             cursor="hand2"
         )
-        status_text.pack(side="left", padx=2)
+        status_label.grid(row=0, column=1, padx=10, pady=8)
 
         # Uptime
         uptime_label = ctk.CTkLabel(
             row_frame,
-            text="-",
-            font=ctk.CTkFont(size=12),
+            textvariable=uptime_var,
+            font=self._font_row,
             text_color=COLORS["subtext"],
             width=90,
             cursor="hand2"
@@ -275,14 +381,13 @@ class Dashboard(ctk.CTkFrame):
         play_btn = ctk.CTkButton(
             actions_frame,
             text="",
-            image=Icons.get("play"),
+            image=self._ico["play"],
             width=32,
             height=32,
             corner_radius=4,
             fg_color=COLORS["green"],
             hover_color="#86c381",
-            text_color="#1e1e2e",
-            command=lambda pid=project.id: self._on_start_project(pid)
+            text_color="#1e1e2e"
         )
         play_btn.pack(side="left", padx=2)
 
@@ -290,14 +395,13 @@ class Dashboard(ctk.CTkFrame):
         stop_btn = ctk.CTkButton(
             actions_frame,
             text="",
-            image=Icons.get("stop"),
+            image=self._ico["stop"],
             width=32,
             height=32,
             corner_radius=4,
             fg_color=COLORS["red"],
             hover_color="#e06080",
-            text_color="#1e1e2e",
-            command=lambda pid=project.id: self._on_stop_project(pid)
+            text_color="#1e1e2e"
         )
         stop_btn.pack(side="left", padx=2)
 
@@ -305,14 +409,13 @@ class Dashboard(ctk.CTkFrame):
         edit_btn = ctk.CTkButton(
             actions_frame,
             text="",
-            image=Icons.get("settings"),
+            image=self._ico["settings"],
             width=32,
             height=32,
             corner_radius=4,
             fg_color=COLORS["overlay"],
             hover_color=COLORS["mauve"],
-            text_color=COLORS["text"],
-            command=lambda pid=project.id: self._on_edit_project(pid)
+            text_color=COLORS["text"]
         )
         edit_btn.pack(side="left", padx=2)
 
@@ -320,102 +423,177 @@ class Dashboard(ctk.CTkFrame):
         delete_btn = ctk.CTkButton(
             actions_frame,
             text="",
-            image=Icons.get("trash"),
+            image=self._ico["trash"],
             width=32,
             height=32,
             corner_radius=4,
             fg_color=COLORS["overlay"],
             hover_color=COLORS["red"],
-            text_color=COLORS["subtext"],
-            command=lambda pid=project.id, pname=project.name: self._on_delete_project(pid, pname)
+            text_color=COLORS["subtext"]
         )
         delete_btn.pack(side="left", padx=2)
 
-        # Bind hover events to all widgets in the row
-        all_widgets = [
-            row_frame, name_label, status_frame, status_dot, status_text,
-            uptime_label, actions_frame, play_btn, stop_btn,
-            edit_btn, delete_btn
-        ]
-
-        # Use a localized job variable for this row
-        row_frame.leave_job = None
-
-        def on_enter(_event):
-            # Cancel any pending leave job
-            if row_frame.leave_job:
-                row_frame.after_cancel(row_frame.leave_job)
-                row_frame.leave_job = None
-
-            # Always show blue border on hover
-            row_frame.configure(border_color=COLORS["blue"])
-
-        def _do_leave():
-            row_frame.leave_job = None
-            # Only hide border if this project's logs are not currently open
-            if self.active_log_project_id == project.id:
-                row_frame.configure(border_color=COLORS["blue"])
-            else:
-                row_frame.configure(border_color=COLORS["surface"])
-
-        def on_leave(_event):
-            # Schedule clearing the border
-            if row_frame.leave_job:
-                row_frame.after_cancel(row_frame.leave_job)
-            row_frame.leave_job = row_frame.after(50, _do_leave)
-
-        for widget in all_widgets:
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            # Bind click only to non-button widgets (first 6 in the list)
-            if widget not in (play_btn, stop_btn, edit_btn, delete_btn, actions_frame):
-                widget.bind("<Button-1>", on_click_visual)
+        # Hover and click are dispatched by class bindings set up once in _setup_ui;
+        # the action buttons only get hover, since clicking them must not open logs.
+        # They have no per-row command either: _on_row_action reads the action from
+        # the button and the project from the row
+        for button, action in ((play_btn, "start"), (stop_btn, "stop"),
+                               (edit_btn, "edit"), (delete_btn, "delete")):
+            button.row_action = action
+            _add_bindtag(button, (ROW_ACTION_TAG,))
+        self._row_paths[str(row_frame)] = project_id
+        for child in row_frame.winfo_children():
+            if child is not actions_frame:
+                _add_bindtag(child, (ROW_TAG, ROW_CLICK_TAG))
+        row_frame.bindtags((ROW_TAG, ROW_CLICK_TAG) + row_frame.bindtags())
+        _add_bindtag(actions_frame, (ROW_TAG,))
 
         # Store widgets for updates
         self.project_rows[project.id] = {
             "frame": row_frame,
             "name": name_label,
-            "status_dot": status_dot,
-            "status_text": status_text,
+            "status": status_label,
+            "status_var": status_var,
+            "status_color": COLORS["subtext"],
             "uptime": uptime_label,
+            "uptime_var": uptime_var,
             "play_btn": play_btn,
             "stop_btn": stop_btn,
-            "project": project
+            "project": project,
+            "index": row_index,
+            "leave_job": None
         }
+        self._project_snapshot[project_id] = (
+            project.name, project.entrypoint, project.interpreter_path
+        )
 
-        # Update initial status
+        # Seed the pushed-status cache; later changes arrive via update_project_status
+        if status == ProcessStatus.RUNNING and uptime is not None:
+            self._run_started[project_id] = time.monotonic() - uptime
         self._update_row_status(project.id, status)
 
-    def _update_row_status(self, project_id: int, status: ProcessStatus):
-        """Update the visual status of a project row."""
-        if project_id not in self.project_rows:
+    def _row_id_from_event(self, event) -> Optional[int]:
+        """Find the project whose row contains the event's widget."""
+        widget = event.widget
+        while widget is not None:
+            project_id = self._row_paths.get(str(widget))
+            if project_id is not None:
+                return project_id
+            widget = getattr(widget, "master", None)
+        return None
+
+    def _on_row_enter(self, event):
+        """Highlight a row while hovered."""
+        project_id = self._row_id_from_event(event)
+        if project_id is None:
             return
+        row = self.project_rows[project_id]
 
+        # Cancel any pending leave job (moving between widgets of the same row)
+        if row["leave_job"]:
+            self.after_cancel(row["leave_job"])
+            row["leave_job"] = None
+
+        # Always show blue border on hover
+        row["frame"].configure(border_color=COLORS["blue"])
+
+    def _on_row_leave(self, event):
+        """Schedule clearing a row's hover border."""
+        project_id = self._row_id_from_event(event)
+        if project_id is None:
+            return
         row = self.project_rows[project_id]
+        if row["leave_job"]:
+            self.after_cancel(row["leave_job"])
+        row["leave_job"] = self.after(50, self._finish_row_leave, project_id)
+
+    def _finish_row_leave(self, project_id: int):
+        """Clear the hover border unless the row's logs are open."""
+        row = self.project_rows.get(project_id)
+        if row is None:
+            return
+        row["leave_job"] = None
+        # Only hide border if this project's logs are not currently open
+        if self.active_log_project_id == project_id:
+            row["frame"].configure(border_color=COLORS["blue"])
+        else:
+            row["frame"].configure(border_color=COLORS["surface"])
+
+    def _on_row_click(self, event):
+        """Mark the clicked row as active and open its logs."""
+        project_id = self._row_id_from_event(event)
+        if project_id is None:
+            return
 
-        # Colors and text for each status
-        status_config = {
-            ProcessStatus.STOPPED: (COLORS["subtext"], "Stopped", False),
-            ProcessStatus.STARTING: (COLORS["yellow"], "Starting...", False),
-            ProcessStatus.RUNNING: (COLORS["green"], "Running", True),
-            ProcessStatus.STOPPING: (COLORS["yellow"], "Stopping...", False),
-            ProcessStatus.CRASHED: (COLORS["red"], "Crashed", False),
-        }
+        if (self.active_log_project_id is not None
+                and self.active_log_project_id in self.project_rows):
+            old_row = self.project_rows[self.active_log_project_id]["frame"]
+            old_row.configure(border_color=COLORS["surface"])
 
-        color, text, is_running = status_config.get(status, (COLORS["subtext"], "Unknown", False))
+        # Set this project as active
+        self.active_log_project_id = project_id
 
-        row["status_dot"].configure(text_color=color)
-        row["status_text"].configure(text=text, text_color=color)
+        # Show border
+        row = self.project_rows[project_id]
+        row["frame"].configure(border_color=COLORS["blue"])
+        # Open logs (rows are reused across edits, so read the current name)
+        self.on_view_logs(project_id, row["project"].name)
+
+    def _update_row_status(self, project_id: int, status: ProcessStatus):
+        """Update the visual status of a project row."""
+        if project_id not in self._status_cache:
+            return  # Not a listed project
+
+        self._status_cache[project_id] = status
+        row = self.project_rows.get(project_id)
+        if row is None:
+            return  # Row is still pending; it is created with the cached status
+
+        color, text, is_running = _STATUS_CONFIG.get(status, _UNKNOWN_STATUS)
+
+        row["status_var"].set(text)
+        if row["status_color"] != color:
+            row["status_color"] = color
+            row["status"].configure(text_color=color)
+
+        if is_running:
+            self._run_started.setdefault(project_id, time.monotonic())
+        else:
+            self._run_started.pop(project_id, None)
+            row["uptime_var"].set("-")
+            self._last_uptime_text.pop(project_id, None)
+
+    def _on_row_action(self, event):
+        """Run the action of a row button for that row's project."""
+        button = event.widget
+        while button is not None and not hasattr(button, "row_action"):
+            button = getattr(button, "master", None)
+        if button is None or button.cget("state") == "disabled":
+            return
+        # Like CTkButton, only count the click if released over the button
+        target = str(self.winfo_containing(event.x_root, event.y_root))
+        if target != str(button) and not target.startswith(f"{button}."):
+            return
+        project_id = self._row_id_from_event(event)
+        if project_id is None:
+            return
 
-        if not is_running:
-            row["uptime"].configure(text="-")
+        action = button.row_action
+        if action == "start":
+            self._on_start_project(project_id)
+        elif action == "stop":
+            self._on_stop_project(project_id)
+        elif action == "edit":
+            self._on_edit_project(project_id)
+        elif action == "delete":
+            self._on_delete_project(project_id, self.project_rows[project_id]["project"].name)
 
     def _on_add_project(self):
         """Show add project dialog."""
         from hamal.ui.dialogs import AddProjectDialog  # pylint: disable=import-outside-toplevel
         dialog = AddProjectDialog(self.winfo_toplevel())
         if dialog.get_result():
-            self._refresh_projects()
+            self._schedule_refresh()
 
     def _on_start_project(self, project_id: int):
         """Start a project."""
@@ -434,7 +612,7 @@ class Dashboard(ctk.CTkFrame):
         if project:
             dialog = EditProjectDialog(self.winfo_toplevel(), project)
             if dialog.get_result():
-                self._refresh_projects()
+                self._schedule_refresh()
 
     def _on_delete_project(self, project_id: int, project_name: str):
         """Delete a project."""
@@ -446,19 +624,15 @@ class Dashboard(ctk.CTkFrame):
 
         self.process_manager.stop_project(project_id)
         delete_project(project_id)
-        self._refresh_projects()
+        self._schedule_refresh()
 
     def _on_start_all(self):
         """Start all stopped projects."""
-        projects = get_all_projects()
-        for project in projects:
-            status = self.process_manager.get_status(project.id)
-            if status in (ProcessStatus.STOPPED, ProcessStatus.CRASHED):
-                self.process_manager.start_project(project)
+        self.process_manager.start_all(get_all_projects())
 
     def _on_stop_all(self):
         """Stop all running projects."""
-        self.process_manager.stop_all()
+        self.process_manager.stop_all(parallel=True)
 
     def update_project_status(self, project_id: int, status_str: str):
         """Update a project's status display."""
@@ -470,23 +644,22 @@ class Dashboard(ctk.CTkFrame):
 
     def _update_uptimes(self):
         """Update uptime display for running projects."""
-        for project_id, row in self.project_rows.items():
-            status = self.process_manager.get_status(project_id)
-            if status == ProcessStatus.RUNNING:
-                uptime = self.process_manager.get_uptime(project_id)
-                if uptime is not None:
-                    row["uptime"].configure(text=format_uptime(uptime))
+        # Hidden (e.g. minimized) widgets don't need updating; just re-arm the timer
+        if self.winfo_viewable():
+            now = time.monotonic()
+            for project_id, started in self._run_started.items():
+                # Only touch the label (a Tcl round-trip) when the text changes
+                text = format_uptime(now - started)
+                if self._last_uptime_text.get(project_id) != text:
+                    self._last_uptime_text[project_id] = text
+                    self.project_rows[project_id]["uptime_var"].set(text)
 
         self.after(1000, self._update_uptimes)
 
     def get_project_count(self) -> int:
         """Get total number of projects."""
-        return len(self.project_rows)
+        return self._project_count
 
     def get_running_count(self) -> int:
         """Get number of running projects."""
-        count = 0
-        for project_id in self.project_rows:
-            if self.process_manager.get_status(project_id) == ProcessStatus.RUNNING:
-                count += 1
-        return count
+        return sum(1 for status in self._status_cache.values() if status == ProcessStatus.RUNNING)
@@ -1,14 +1,61 @@
 """Dialog windows for adding and editing projects."""
 
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import customtkinter as ctk
 
-from hamal.database.models import Project
-from hamal.database.crud import create_project, update_project
-from hamal.utils.helpers import detect_python_interpreter, detect_entry_file, get_python_files
+from hamal.core.project_scanner import ScanResult
+from hamal.utils.helpers import get_python_files, scan_project
+
+if TYPE_CHECKING:
+    from hamal.database.models import Project
+
+
+# Database writes from the dialogs run here so the Tk thread never blocks on SQLite.
+# A single worker keeps writes serialized.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hamal-db")
+
+
+def _submit_db_job(dialog, buttons: tuple, error_message: str, func, **kwargs):
+    """Run a database call off the UI thread, closing the dialog with its result when done."""
+    # The dialog can't be closed while the write runs: closing it would drop the
+    # result, and the caller would never learn that the database changed
+    for button in buttons:
+        button.configure(state="disabled")
+    dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+    future = _DB_EXECUTOR.submit(func, **kwargs)
+    dialog.after(50, _poll_db_job, dialog, buttons, error_message, future)
+
+
+def _poll_db_job(dialog, buttons: tuple, error_message: str, future: Future):
+    """Check a submitted database call from the Tk thread."""
+    if not dialog.winfo_exists():
+        return
+    if not future.done():
+        dialog.after(50, _poll_db_job, dialog, buttons, error_message, future)
+        return
+
+    try:
+        dialog.result = future.result()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        for button in buttons:
+            button.configure(state="normal")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.destroy)
+        messagebox.showerror("Error", f"{error_message}: {e}")
+        return
+    dialog.destroy()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Font shared by all dialogs, created on first use (needs a Tk root)."""
+    return ctk.CTkFont(size=size, weight=weight)
 
 
 class AddProjectDialog(ctk.CTkToplevel):
@@ -18,6 +65,7 @@ class AddProjectDialog(ctk.CTkToplevel):
         super().__init__(master)
 
         self.result = None
+        self._scan_folder: Optional[str] = None  # Folder of the latest background scan
 
         # Window config
         self.title("Add Project")
@@ -47,7 +95,7 @@ class AddProjectDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="Add New Project",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_get_font(20, "bold")
         )
         title.grid(row=0, column=0, padx=20, pady=(20, 10))
 
@@ -123,7 +171,7 @@ class AddProjectDialog(ctk.CTkToplevel):
         self.status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_get_font(12),
             text_color=("gray50", "gray50")
         )
         self.status_label.grid(row=2, column=0, padx=20, pady=5)
@@ -132,7 +180,7 @@ class AddProjectDialog(ctk.CTkToplevel):
         buttons = ctk.CTkFrame(self, fg_color="transparent")
         buttons.grid(row=3, column=0, padx=20, pady=20)
 
-        cancel_btn = ctk.CTkButton(
+        self.cancel_btn = ctk.CTkButton(
             buttons,
             text="Cancel",
             width=100,
@@ -140,15 +188,15 @@ class AddProjectDialog(ctk.CTkToplevel):
             border_width=1,
             command=self.destroy
         )
-        cancel_btn.pack(side="left", padx=10)
+        self.cancel_btn.pack(side="left", padx=10)
 
-        add_btn = ctk.CTkButton(
+        self.add_btn = ctk.CTkButton(
             buttons,
             text="Add Project",
             width=100,
             command=self._on_add
         )
-        add_btn.pack(side="left", padx=10)
+        self.add_btn.pack(side="left", padx=10)
 
     def _browse_folder(self):
         """Browse for project folder."""
@@ -170,10 +218,24 @@ class AddProjectDialog(ctk.CTkToplevel):
             initialdir=initial_dir,
             filetypes=[("Python files", "*.py"), ("All files", "*.*")]
         )
-        if file:
-            # Store only the filename, not full path
-            self.entry_entry.delete(0, "end")
-            self.entry_entry.insert(0, Path(file).name)
+        if not file:
+            return
+
+        entry = Path(file).name
+        if folder:
+            # Entry is stored relative to the project folder; a normalized
+            # prefix test avoids relative_to() and its ValueError path
+            folder_norm = os.path.normcase(os.path.abspath(folder)).rstrip(os.sep) + os.sep
+            file_norm = os.path.normcase(os.path.abspath(file))
+            if not file_norm.startswith(folder_norm):
+                messagebox.showwarning(
+                    "Warning", "The entry file must be inside the project folder"
+                )
+                return
+            entry = os.path.abspath(file)[len(folder_norm):].replace(os.sep, "/")
+
+        self.entry_entry.delete(0, "end")
+        self.entry_entry.insert(0, entry)
 
     def _browse_python(self):
         """Browse for Python interpreter."""
@@ -186,9 +248,30 @@ class AddProjectDialog(ctk.CTkToplevel):
             self.python_entry.insert(0, file)
 
     def _auto_detect(self, folder: str):
-        """Auto-detect project settings."""
+        """Auto-detect project settings without blocking the dialog."""
+        self._scan_folder = folder
+        self.status_label.configure(text="Scanning project folder...")
+
+        # The default name needs no scan, so fill it in right away
+        if not self.name_entry.get():
+            self.name_entry.insert(0, os.path.basename(os.path.normpath(folder)))
+
+        threading.Thread(target=self._scan_worker, args=(folder,), daemon=True).start()
+
+    def _scan_worker(self, folder: str):
+        """Scan the project folder off the UI thread."""
+        # One scan finds both the interpreter and the entry file
+        result = scan_project(folder)
+        self.after(0, self._apply_scan_result, folder, result)
+
+    def _apply_scan_result(self, folder: str, result: ScanResult):
+        """Fill in the detected settings (runs on the UI thread)."""
+        # Dialog closed, or a different folder was picked meanwhile
+        if not self.winfo_exists() or folder != self._scan_folder:
+            return
+
         # Detect Python
-        python = detect_python_interpreter(folder)
+        python = result.interpreter
         if python:
             self.python_entry.delete(0, "end")
             self.python_entry.insert(0, python)
@@ -197,17 +280,12 @@ class AddProjectDialog(ctk.CTkToplevel):
             self.status_label.configure(text="⚠ No venv found - please select Python manually")
 
         # Detect entry file
-        entry = detect_entry_file(folder)
+        entry = result.entrypoint
 
         if entry:
             self.entry_entry.delete(0, "end")
             self.entry_entry.insert(0, entry)
 
-        # Auto-set name from folder
-        if not self.name_entry.get():
-            folder_name = Path(folder).name
-            self.name_entry.insert(0, folder_name)
-
     def _on_add(self):
         """Handle add button click."""
         folder = self.folder_entry.get().strip()
@@ -232,20 +310,17 @@ class AddProjectDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", "Please select a Python interpreter")
             return
 
-        # Create project
-        try:
-            project = create_project(
-                name=name,
-                folder_path=folder,
-                entrypoint=entry,
-                interpreter_path=python
-            )
-            self.result = project
-            self.destroy()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            messagebox.showerror("Error", f"Failed to create project: {e}")
-
-    def get_result(self) -> Optional[Project]:
+        # Create project (the database layer is only needed once the user confirms)
+        from hamal.database.crud import create_project  # pylint: disable=import-outside-toplevel
+        _submit_db_job(
+            self, (self.add_btn, self.cancel_btn), "Failed to create project", create_project,
+            name=name,
+            folder_path=folder,
+            entrypoint=entry,
+            interpreter_path=python
+        )
+
+    def get_result(self) -> Optional["Project"]:
         """Get the created project (or None if cancelled)."""
         return self.result
 
@@ -253,7 +328,7 @@ class AddProjectDialog(ctk.CTkToplevel):
 class EditProjectDialog(ctk.CTkToplevel):
     """Dialog for editing an existing project."""
 
-    def __init__(self, master, project: Project):
+    def __init__(self, master, project: "Project"):
         super().__init__(master)
 
         self.project = project
@@ -287,7 +362,7 @@ class EditProjectDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="Edit Project",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_get_font(20, "bold")
         )
         title.grid(row=0, column=0, padx=20, pady=(20, 10))
 
@@ -315,18 +390,16 @@ class EditProjectDialog(ctk.CTkToplevel):
         # Entry file
         ctk.CTkLabel(form, text="Entry File:").grid(row=2, column=0, padx=5, pady=10, sticky="e")
 
-        py_files = get_python_files(self.project.folder_path)
-        if not py_files:
-            py_files = [self.project.entrypoint]
-
+        # Start with the current entry; the folder scan runs once the dialog is shown
         self.entry_var = ctk.StringVar(value=self.project.entrypoint)
         self.entry_combo = ctk.CTkComboBox(
             form,
             variable=self.entry_var,
-            values=py_files,
+            values=[self.project.entrypoint],
             state="readonly"
         )
         self.entry_combo.grid(row=2, column=1, padx=5, pady=10, sticky="ew")
+        self.after_idle(self._populate_py_files)
 
         # Python interpreter
         ctk.CTkLabel(form, text="Python:").grid(row=3, column=0, padx=5, pady=10, sticky="e")
@@ -351,7 +424,7 @@ class EditProjectDialog(ctk.CTkToplevel):
         buttons = ctk.CTkFrame(self, fg_color="transparent")
         buttons.grid(row=3, column=0, padx=20, pady=20)
 
-        cancel_btn = ctk.CTkButton(
+        self.cancel_btn = ctk.CTkButton(
             buttons,
             text="Cancel",
             width=100,
@@ -359,15 +432,27 @@ class EditProjectDialog(ctk.CTkToplevel):
             border_width=1,
             command=self.destroy
         )
-        cancel_btn.pack(side="left", padx=10)
+        self.cancel_btn.pack(side="left", padx=10)
 
-        save_btn = ctk.CTkButton(
+        self.save_btn = ctk.CTkButton(
             buttons,
             text="Save Changes",
             width=100,
             command=self._on_save
         )
-        save_btn.pack(side="left", padx=10)
+        self.save_btn.pack(side="left", padx=10)
+
+    def _populate_py_files(self):
+        """Fill the entry file choices from a scan of the project folder."""
+        if not self.winfo_exists():
+            return
+        # Not memoized: the walk is recursive, so no cheap key covers every subfolder
+        try:
+            py_files = get_python_files(self.project.folder_path)
+        except OSError:
+            py_files = []
+        if py_files:
+            self.entry_combo.configure(values=py_files)
 
     def _browse_python(self):
         """Browse for Python interpreter."""
@@ -399,18 +484,15 @@ class EditProjectDialog(ctk.CTkToplevel):
             return
 
         # Update project
-        try:
-            project = update_project(
-                project_id=self.project.id,
-                name=name,
-                entrypoint=entry,
-                interpreter_path=python
-            )
-            self.result = project
-            self.destroy()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            messagebox.showerror("Error", f"Failed to update project: {e}")
-
-    def get_result(self) -> Optional[Project]:
+        from hamal.database.crud import update_project  # pylint: disable=import-outside-toplevel
+        _submit_db_job(
+            self, (self.save_btn, self.cancel_btn), "Failed to update project", update_project,
+            project_id=self.project.id,
+            name=name,
+            entrypoint=entry,
+            interpreter_path=python
+        )
+
+    def get_result(self) -> Optional["Project"]:
         """Get the updated project (or None if cancelled)."""
         return self.result
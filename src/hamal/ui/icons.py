@@ -1,10 +1,14 @@
 """Icon resources from hamal."""
 
+import os
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from PIL import Image
-import customtkinter as ctk
+# customtkinter is imported in Icons.load(); this is for annotations only
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
 def get_icons_dir() -> Path:
     """Get the icons directory path, works both in dev and packaged app."""
@@ -23,6 +27,7 @@ class Icons:
 
     _icons: dict = {}
     _loaded: bool = False
+    _load_thread: Optional[threading.Thread] = None
 
     @classmethod
     def load(cls):
@@ -30,6 +35,17 @@ class Icons:
         if cls._loaded:
             return
 
+        # A background load is in progress: wait for it instead of loading twice
+        thread = cls._load_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            if cls._loaded:
+                return
+
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import customtkinter as ctk
+        from PIL import Image
+
         icon_names = [
             "play", "stop", "plus", "settings", 
             "trash", "logs", "folder", "clear"
@@ -38,26 +54,43 @@ class Icons:
         icons_dir = get_icons_dir()
         print(f"[Icons] Loading from: {icons_dir}")
 
+        # One directory listing instead of an exists() stat per icon
+        try:
+            with os.scandir(icons_dir) as it:
+                available = {entry.name: entry.path for entry in it if entry.name.endswith(".png")}
+        except OSError as e:
+            print(f"[Icons] Cannot list {icons_dir}: {e}")
+            available = {}
+
         for name in icon_names:
-            path = icons_dir / f"{name}.png"
+            path = available.get(f"{name}.png")
             try:
-                if path.exists():
+                if path is not None:
                     img = Image.open(path)
-                    cls._icons[name] = ctk.CTkImage(
-                        light_image=img,
-                        dark_image=img,
-                        size=(18, 18)
-                    )
+                    # Decode now (Image.open is lazy) so widgets don't pay for it later;
+                    # this also releases the file handle
+                    img.load()
+                    # Light image only: CTkImage falls back to it in dark mode, so
+                    # there is a single source image and PhotoImage cache per icon
+                    cls._icons[name] = ctk.CTkImage(light_image=img, size=(18, 18))
                     print(f"[Icons] Loaded: {name}")
                 else:
-                    print(f"[Icons] Not found: {path}")
+                    print(f"[Icons] Not found: {icons_dir / f'{name}.png'}")
             except Exception as e:  # pylint: disable=broad-exception-caught
                 print(f"[Icons] Error loading {name}: {e}")
 
         cls._loaded = True
 
     @classmethod
-    def get(cls, name: str) -> ctk.CTkImage | None:
+    def load_async(cls):
+        """Start loading icons on a background thread; the first get() waits for it."""
+        if cls._loaded or cls._load_thread is not None:
+            return
+        cls._load_thread = threading.Thread(target=cls.load, name="hamal-icons", daemon=True)
+        cls._load_thread.start()
+
+    @classmethod
+    def get(cls, name: str) -> Optional["ctk.CTkImage"]:
         """Get an icon by name."""
         if not cls._loaded:
             cls.load()
@@ -1,13 +1,16 @@
 """Log panel widget using CustomTkinter - Live logs view."""
 
-import os
 import re
 import tkinter as tk
+from collections import deque
+from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
 from typing import Optional
 
 import customtkinter as ctk
 
 from hamal.core.config import get_project_logs_dir
+from hamal.utils.helpers import open_folder_in_explorer
 
 
 # Catppuccin Mocha colors
@@ -24,6 +27,119 @@ COLORS = {
     "yellow": "#f9e2af",
 }
 
+# "[Date] filename.py:line Level] Message" lines emitted by the bots' loggers
+_LOG_LINE_RE = re.compile(
+    r"^(\[\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2}(?:,\d{3})?\])\s+([^ ]+:\d+)\s+([A-Z]\])(.*)"
+)
+# Shortest line _LOG_LINE_RE can match: "[YYYY-MM-DD HH:MM:SS] f:1 X]"
+_LOG_LINE_MIN_LEN = 28
+# Level letter -> tag for the level indicator
+_LEVEL_TAGS = {"I": "info_lvl", "W": "warn_lvl", "E": "err_lvl", "F": "err_lvl"}
+# Levels whose whole message is colored, and those colored only when marked with an emoji
+_LEVEL_MSG_TAGS = {"E": "error", "F": "error"}
+_LEVEL_EMOJI_TAGS = {"W": ("⚠️", "warn"), "I": ("✅", "success")}
+# URLs and absolute paths; the capturing group makes split() keep them at odd indices
+_LINK_RE = re.compile(r"(https?://[^\s]+|[a-zA-Z]:\\[^\s]+|/[^\s]+)")
+# Keyword classes for lines without the structured format (one case-insensitive pass each)
+_FALLBACK_ERROR_RE = re.compile(r"error|traceback|exception|failed|❌", re.IGNORECASE)
+_FALLBACK_WARN_RE = re.compile(r"warn|⚠️", re.IGNORECASE)
+_FALLBACK_SUCCESS_RE = re.compile(r"success|finished|done|✅", re.IGNORECASE)
+
+# Live lines kept per project, and the most lines the text widget will hold
+MAX_LOG_LINES = 1000
+# Minimum interval between auto-scrolls to the end (~30 Hz)
+SCROLL_INTERVAL_MS = 33
+# How often lines submitted by the reader threads are moved into the view
+LOG_DRAIN_INTERVAL_MS = 30
+
+
+def _add_message_segments(segments: list, text: str, base_tag: str = None):
+    """Append text as (chars, tags) insert segments, tagging links."""
+    base_tags = (base_tag,) if base_tag else ()
+    # Every link contains a slash or backslash; most lines have neither
+    if "/" not in text and "\\" not in text:
+        if text:
+            segments += (text, base_tags)
+        return
+    for i, part in enumerate(_LINK_RE.split(text)):
+        if part:
+            segments += (part, ("link",) if i % 2 else base_tags)
+
+
+def parse_line(line: str) -> tuple:
+    """
+    Parse a log line into flat (chars, tags, chars, tags, ...) Text insert segments.
+    Pure function, so it is safe to call from the process reader threads.
+    """
+    segments = []
+    # Try to match the specific log format: [Date] filename.py:line Level] Message
+    match = (_LOG_LINE_RE.match(line)
+             if len(line) >= _LOG_LINE_MIN_LEN and line[0] == "[" else None)
+    if match:
+        timestamp, file_info, level, message = match.groups()
+
+        # Level indicator; the regex guarantees level is "<letter>]"
+        letter = level[0]
+        lvl_tag = _LEVEL_TAGS.get(letter, "info_lvl")
+        base_msg_tag = _LEVEL_MSG_TAGS.get(letter)
+        if base_msg_tag is None and letter in _LEVEL_EMOJI_TAGS:
+            emoji, emoji_tag = _LEVEL_EMOJI_TAGS[letter]
+            if emoji in message:
+                base_msg_tag = emoji_tag
+
+        # Timestamp (green), file path/line (mauve), level
+        segments += (
+            timestamp + " ", ("timestamp",),
+            file_info + " ", ("file",),
+            level, (lvl_tag,),
+        )
+
+        # The message body, with links
+        _add_message_segments(segments, message, base_msg_tag)
+        segments += ("\n", ())
+        return tuple(segments)
+
+    # Fallback parsing for lines that aren't matching the standard log structure (e.g. ASCII art)
+    base_tag = None
+
+    if _FALLBACK_ERROR_RE.search(line):
+        base_tag = "error"
+    elif _FALLBACK_WARN_RE.search(line):
+        base_tag = "warn"
+    elif _FALLBACK_SUCCESS_RE.search(line):
+        base_tag = "success"
+
+    _add_message_segments(segments, line, base_tag)
+    if not line.endswith("\n"):
+        segments += ("\n", ())
+    return tuple(segments)
+
+
+# What parse_line returns for an empty line
+_BLANK_LINE = ("\n", ())
+
+
+def _with_repeat_count(parsed: tuple, count: int) -> tuple:
+    """A parsed line with "  (xN)" appended before its trailing newline."""
+    suffix = f"  (x{count})"
+    chars, tags = parsed[-2], parsed[-1]
+    if chars == "\n":
+        return parsed[:-2] + (suffix, (), "\n", ())
+    # Fallback lines that already ended with a newline keep it in their last segment
+    return parsed[:-2] + (chars.rstrip("\n"), tags, suffix + "\n", ())
+
+
+@dataclass(slots=True)
+class LogPanelState:
+    """Data held by a LogPanel, kept off the widget's instance dict."""
+    current_project_id: Optional[int] = None
+    current_project_name: str = ""
+    # Bounded per-project history of parsed lines; deque(maxlen) drops the oldest in O(1)
+    logs: dict[int, deque[tuple]] = field(default_factory=dict)
+    # Parsed lines for the shown project waiting for the next flush
+    pending_lines: list[tuple] = field(default_factory=list)
+    has_content: bool = False  # Whether the textbox shows any log lines
+
 
 class LogPanel(ctk.CTkFrame):
     """Panel for displaying LIVE project logs."""
@@ -32,17 +148,28 @@ class LogPanel(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
 
-        self.current_project_id: Optional[int] = None
-        self.current_project_name: str = ""
-        self.logs: dict[int, list[str]] = {}
+        self.state = LogPanelState()
+        self._flush_scheduled = False
+        # Throttled auto-scroll state
+        self._needs_scroll = False
+        self._scroll_scheduled = False
+        # (project_id, parsed line) handed over by the reader threads
+        self._parse_queue: SimpleQueue = SimpleQueue()
 
         self._setup_ui()
+        self.after(LOG_DRAIN_INTERVAL_MS, self._drain_queue)
 
     def _setup_ui(self):
         """Setup the log panel UI."""
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
+        # Widgets with the same font spec share one CTkFont (each is a named Tk font)
+        self._font_title = ctk.CTkFont(size=18, weight="bold")
+        self._font_11 = ctk.CTkFont(size=11)
+        self._font_11_bold = ctk.CTkFont(size=11, weight="bold")
+        self._font_mono = ctk.CTkFont(family="Consolas", size=11)
+
         # === HEADER ===
         self.header = ctk.CTkFrame(self, fg_color="transparent")
         self.header.grid(row=0, column=0, padx=5, pady=(5, 5), sticky="ew")
@@ -52,7 +179,7 @@ class LogPanel(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             self.header,
             text="Logs",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font_title,
             text_color=COLORS["text"]
         )
         self.title.grid(row=0, column=0, sticky="w", padx=5)
@@ -64,7 +191,7 @@ class LogPanel(ctk.CTkFrame):
         self.live_label = ctk.CTkLabel(
             self.buttons_frame,
             text="● LIVE",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._font_11_bold,
             text_color=COLORS["green"]
         )
         self.live_label.pack(side="left", padx=10)
@@ -73,7 +200,7 @@ class LogPanel(ctk.CTkFrame):
         self.open_folder_btn = ctk.CTkButton(
             self.buttons_frame,
             text="Open Folder",
-            font=ctk.CTkFont(size=11),
+            font=self._font_11,
             width=85,
             height=28,
             corner_radius=4,
@@ -88,7 +215,7 @@ class LogPanel(ctk.CTkFrame):
         self.clear_btn = ctk.CTkButton(
             self.buttons_frame,
             text="Clear",
-            font=ctk.CTkFont(size=11),
+            font=self._font_11,
             width=55,
             height=28,
             corner_radius=4,
@@ -107,13 +234,15 @@ class LogPanel(ctk.CTkFrame):
 
         self.log_text = ctk.CTkTextbox(
             self.log_container,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self._font_mono,
             fg_color=COLORS["base"],
             text_color=COLORS["text"],
             scrollbar_button_color=COLORS["overlay"],
             scrollbar_button_hover_color=COLORS["blue"],
             wrap="none",
-            corner_radius=6
+            corner_radius=6,
+            undo=False,  # Read-only view; an undo stack would just duplicate every insert
+            maxundo=0
         )
         self.log_text.grid(row=0, column=0, padx=3, pady=3, sticky="nsew")
         self.log_text.configure(state="disabled")
@@ -141,7 +270,7 @@ class LogPanel(ctk.CTkFrame):
         self.status_bar = ctk.CTkLabel(
             self,
             text="Select a project to view live logs",
-            font=ctk.CTkFont(size=11),
+            font=self._font_11,
             text_color=COLORS["subtext"],
             anchor="w"
         )
@@ -168,8 +297,8 @@ class LogPanel(ctk.CTkFrame):
     def _show_context_menu(self, event):
         """Show context menu on right click."""
         try:
-            # Only show if there's text
-            if self.log_text.get("1.0", "end-1c").strip() != "":
+            # Only show if there are logs (tracked, so no full-text copy per click)
+            if self.state.has_content:
                 self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
             self.context_menu.grab_release()
@@ -189,6 +318,8 @@ class LogPanel(ctk.CTkFrame):
             
     def _copy_all(self):
         """Copy all log text to clipboard."""
+        if not self.state.has_content:
+            return
         all_text = self.log_text.get("1.0", "end-1c")
         if all_text.strip():
             self.clipboard_clear()
@@ -197,6 +328,7 @@ class LogPanel(ctk.CTkFrame):
 
     def _show_initial_message(self):
         """Show initial message when no project is selected."""
+        self.state.has_content = False
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.insert("end", "\n\n    Select a project and click LOG to view live output.\n")
@@ -204,8 +336,10 @@ class LogPanel(ctk.CTkFrame):
 
     def set_project(self, project_id: int, project_name: str):
         """Set the current project to display live logs for."""
-        self.current_project_id = project_id
-        self.current_project_name = project_name
+        # The view already holds this project's lines; new ones arrive via the flushes
+        same_project = project_id == self.state.current_project_id
+        self.state.current_project_id = project_id
+        self.state.current_project_name = project_name
 
         # Update title
         self.title.configure(text=f"Logs - {project_name}")
@@ -217,122 +351,161 @@ class LogPanel(ctk.CTkFrame):
         self.status_bar.configure(text=f"Viewing live logs for: {project_name}")
 
         # Display existing live logs for this project
-        self._display_logs()
+        if not same_project:
+            self._display_logs()
 
     def _on_open_folder(self):
         """Open the logs folder in file explorer."""
-        if not self.current_project_id:
+        if not self.state.current_project_id:
             return
 
-        logs_dir = get_project_logs_dir(self.current_project_id)
+        logs_dir = get_project_logs_dir(self.state.current_project_id)
         if logs_dir.exists():
-            os.startfile(str(logs_dir))
-
-    def add_log(self, project_id: int, line: str):
-        """Add a live log line for a project."""
-        if project_id not in self.logs:
-            self.logs[project_id] = []
+            open_folder_in_explorer(str(logs_dir))
 
-        self.logs[project_id].append(line)
+    def submit_log(self, project_id: int, line: str):
+        """
+        Queue a live log line from any thread. The line is parsed on the calling
+        thread; the UI thread only stores and inserts the result.
+        """
+        self._parse_queue.put((project_id, parse_line(line)))
 
-        # Keep only last 1000 lines
-        if len(self.logs[project_id]) > 1000:
-            self.logs[project_id] = self.logs[project_id][-1000:]
+    def add_log(self, project_id: int, line: str):
+        """Add a live log line for a project (UI thread)."""
+        self._store(project_id, parse_line(line))
+        if project_id == self.state.current_project_id and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending)
+
+    def _store(self, project_id: int, parsed: tuple):
+        """Keep a parsed line in the project's history, queueing it if it is on screen."""
+        buffer = self.state.logs.get(project_id)
+        if buffer is None:
+            buffer = self.state.logs[project_id] = deque(maxlen=MAX_LOG_LINES)
+        buffer.append(parsed)
+        if project_id == self.state.current_project_id:
+            self.state.pending_lines.append(parsed)
+
+    def _store_run(self, item: tuple, count: int):
+        """Store a (project_id, parsed line) that arrived count times in a row."""
+        project_id, parsed = item
+        if count == 1:
+            self._store(project_id, parsed)
+        elif parsed == _BLANK_LINE:
+            # Runs of empty lines are spacing (e.g. in banners), not repeated messages
+            for _ in range(count):
+                self._store(project_id, parsed)
+        else:
+            self._store(project_id, _with_repeat_count(parsed, count))
 
-        # If this is the current project, display the new line
-        if project_id == self.current_project_id:
-            self._append_line(line)
+    def _drain_queue(self):
+        """Move lines submitted by reader threads into the view, one insert per batch."""
+        # A run of identical lines from the same project in one batch is stored once, as "line  (xN)"
+        previous = None
+        count = 0
+        try:
+            while True:
+                item = self._parse_queue.get_nowait()
+                if item == previous:
+                    count += 1
+                    continue
+                if previous is not None:
+                    self._store_run(previous, count)
+                previous, count = item, 1
+        except Empty:
+            pass
+        if previous is not None:
+            self._store_run(previous, count)
+        if self.state.pending_lines and not self._flush_scheduled:
+            self._flush_pending()
+        self.after(LOG_DRAIN_INTERVAL_MS, self._drain_queue)
 
     def _display_logs(self):
         """Display all live logs for the current project."""
+        # Queued lines are already in self.state.logs and get redrawn below
+        self.state.pending_lines.clear()
+        self.state.has_content = False
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
 
-        if self.current_project_id and self.current_project_id in self.logs:
-            for line in self.logs[self.current_project_id]:
-                self._insert_colored_line(line)
+        if self.state.current_project_id and self.state.current_project_id in self.state.logs:
+            self._insert_parsed(self.state.logs[self.state.current_project_id])
         else:
             self.log_text.insert(
-                "end", f"\n    Waiting for output from {self.current_project_name}...\n"
+                "end", f"\n    Waiting for output from {self.state.current_project_name}...\n"
             )
             self.log_text.insert("end", "    Start the project to see live logs.\n")
 
         self.log_text.configure(state="disabled")
         self.log_text.see("end")
 
-    def _insert_message_with_links(self, text: str, base_tag: str = None):
-        """Helper to insert text while processing links."""
-        link_pattern = r"(https?://[^\s]+|[a-zA-Z]:\\[^\s]+|/[^\s]+)"
-        parts = re.split(link_pattern, text)
-        for part in parts:
-            if not part:
-                continue
-            if re.match(link_pattern, part):
-                self.log_text.insert("end", part, "link")
-            else:
-                args = ("end", part) if not base_tag else ("end", part, base_tag)
-                self.log_text.insert(*args)
-
-    def _insert_colored_line(self, line: str):
-        """Parse a line and insert it with appropriate color tags."""
-        # Try to match the specific log format: [Date] filename.py:line Level] Message
-        match = re.match(r"^(\[\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2}(?:,\d{3})?\])\s+([^ ]+:\d+)\s+([A-Z]\])(.*)", line)
-        if match:
-            timestamp, file_info, level, message = match.groups()
-            
-            # Insert Timestamp (green)
-            self.log_text.insert("end", timestamp + " ", "timestamp")
-            
-            # Insert File path/line (mauve)
-            self.log_text.insert("end", file_info + " ", "file")
-            
-            # Insert Level indicator
-            lvl_tag = "info_lvl"
-            base_msg_tag = None
-            if "W]" in level:
-                lvl_tag = "warn_lvl"
-                base_msg_tag = "warn" if "⚠️" in message else None
-            elif "E]" in level or "F]" in level:
-                lvl_tag = "err_lvl"
-                base_msg_tag = "error"
-            elif "I]" in level:
-                lvl_tag = "info_lvl"
-                if "✅" in message:
-                    base_msg_tag = "success"
-                
-            self.log_text.insert("end", level, lvl_tag)
-            
-            # Insert the message body natively and handle links
-            self._insert_message_with_links(message, base_msg_tag)
-            self.log_text.insert("end", "\n")
+    def _insert_parsed(self, parsed_lines):
+        """Insert pre-parsed lines with their color tags using a single Text insert call."""
+        # Adjacent segments with the same tags (e.g. untagged banner lines and their
+        # newlines) are merged, so a block of plain lines becomes one chars argument
+        segments = []
+        run: list[str] = []
+        run_tags = None
+        for parsed in parsed_lines:
+            for i in range(0, len(parsed), 2):
+                tags = parsed[i + 1]
+                if tags != run_tags:
+                    if run:
+                        segments += ("".join(run), run_tags)
+                    run = []
+                    run_tags = tags
+                run.append(parsed[i])
+        if run:
+            segments += ("".join(run), run_tags)
+        if segments:
+            self.state.has_content = True
+            # Tk's "insert index chars tagList chars tagList ..." form; CTkTextbox.insert
+            # only forwards a single segment, so go to the underlying tk.Text
+            self.log_text._textbox.insert("end", *segments)  # pylint: disable=protected-access
+
+    def _flush_pending(self):
+        """Append all queued lines with a single state toggle and scroll."""
+        self._flush_scheduled = False
+        if not self.state.pending_lines:
             return
+        lines, self.state.pending_lines = self.state.pending_lines, []
 
-        # Fallback parsing for lines that aren't matching the standard log structure (e.g. ASCII art)
-        line_lower = line.lower()
-        base_tag = None
-        
-        if "error" in line_lower or "traceback" in line_lower or "exception" in line_lower or "failed" in line_lower or "❌" in line:
-            base_tag = "error"
-        elif "warn" in line_lower or "⚠️" in line:
-            base_tag = "warn"
-        elif "success" in line_lower or "finished" in line_lower or "done" in line_lower or "✅" in line:
-            base_tag = "success"
-
-        self._insert_message_with_links(line, base_tag)
-        if not line.endswith("\n"):
-            self.log_text.insert("end", "\n")
-
-    def _append_line(self, line: str):
-        """Append a single line to the log display."""
+        # Follow the tail only if the view was already at the bottom (user may have scrolled up)
+        at_bottom = self.log_text.yview()[1] >= 1.0
         self.log_text.configure(state="normal")
-        self._insert_colored_line(line)
+        self._insert_parsed(lines)
+        self._trim_display()
         self.log_text.configure(state="disabled")
-        self.log_text.see("end")
+        if at_bottom:
+            self._request_scroll()
+
+    def _request_scroll(self):
+        """Scroll to the end at most once per SCROLL_INTERVAL_MS; see() forces a re-layout."""
+        self._needs_scroll = True
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.after(SCROLL_INTERVAL_MS, self._scroll_tick)
+
+    def _scroll_tick(self):
+        """Apply a pending scroll to the end."""
+        self._scroll_scheduled = False
+        if self._needs_scroll:
+            self._needs_scroll = False
+            self.log_text.see("end")
+
+    def _trim_display(self):
+        """Drop the oldest lines so the widget never holds more than MAX_LOG_LINES."""
+        # "end-1c" is on the last (empty) line after the trailing newline
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
 
     def _clear_logs(self):
         """Clear logs for the current project."""
-        if self.current_project_id:
-            self.logs[self.current_project_id] = []
+        if self.state.current_project_id in self.state.logs:
+            self.state.logs[self.state.current_project_id].clear()
+        self.state.pending_lines.clear()
+        self.state.has_content = False
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
@@ -1,5 +1,8 @@
 """Main application window using CustomTkinter."""
 
+import os
+from collections import deque
+import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 
@@ -11,6 +14,10 @@ from hamal.ui.icons import get_icons_dir
 from hamal.ui.about_dialog import AboutDialog
 
 
+# Quiet period after the last <Configure> before the layout mode is re-evaluated
+RESIZE_DEBOUNCE_MS = 50
+
+
 # Catppuccin Mocha colors
 COLORS = {
     "base": "#1e1e2e",
@@ -42,23 +49,33 @@ class MainWindow(ctk.CTk):
 
         # Set window icon
         try:
-            icons_dir = get_icons_dir()
-            icon_ico = icons_dir / "icon.ico"
-
-            # Windows: iconbitmap is preferred for title bar
-            if icon_ico.exists():
-                self.iconbitmap(icon_ico)
-
-            # Fallback / Cross-platform support with PNGs
-            from PIL import Image, ImageTk  # pylint: disable=import-outside-toplevel
-            icon_images = []
-            for size in ["256", "48", "32", "16"]:
-                path = icons_dir / f"{size}.png"
-                if path.exists():
-                    icon_images.append(ImageTk.PhotoImage(Image.open(path)))
-
-            if icon_images:
-                self.iconphoto(True, *icon_images)
+            # One directory listing instead of an exists() check per icon file
+            with os.scandir(get_icons_dir()) as it:
+                present = {entry.name: entry.path for entry in it if entry.is_file()}
+
+            # Windows: iconbitmap is preferred for title bar; the .ico carries every size
+            bitmap_set = False
+            if "icon.ico" in present:
+                try:
+                    self.iconbitmap(present["icon.ico"])
+                    bitmap_set = True
+                except tk.TclError:
+                    pass  # .ico files are only supported on Windows
+
+            # Fallback / Cross-platform support with a PNG; the window manager scales
+            # one reasonably sized image, so the others don't need to be decoded
+            if not bitmap_set:
+                icon_path = next(
+                    (present[name] for name in ("48.png", "32.png", "256.png", "16.png")
+                     if name in present),
+                    None
+                )
+                # Pillow (and its plugin registry) is only imported when there is something to load
+                if icon_path is not None:
+                    from PIL import Image, ImageTk  # pylint: disable=import-outside-toplevel
+                    with Image.open(icon_path) as img:
+                        photo = ImageTk.PhotoImage(img)
+                    self.iconphoto(True, photo)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             print(f"Failed to set window icon: {e}")
@@ -69,9 +86,20 @@ class MainWindow(ctk.CTk):
         # Process manager
         self.process_manager = ProcessManager()
 
+        # Last (total, running) counts shown in the status bar
+        self._status_cache: tuple[int, int] | None = None
+
+        # (project_id, status) from worker threads; deque append/popleft are thread-safe
+        self._status_queue: deque[tuple[int, str]] = deque()
+        self._status_drain_scheduled = False
+
         # Setup callbacks
         self._setup_callbacks()
 
+        # Fonts are created once, after the root exists (each CTkFont is a named Tk font)
+        self._menu_font = ctk.CTkFont(size=12)
+        self._status_font = ctk.CTkFont(size=11)
+
         # Build UI
         self._setup_menu()
         self._setup_ui()
@@ -97,9 +125,6 @@ class MainWindow(ctk.CTk):
         self.custom_menu_bar.grid(row=0, column=0, columnspan=2, sticky="ew")
         self.custom_menu_bar.grid_propagate(False)
 
-        # Active dropdown tracking
-        self._active_menu = None
-
         # Container frame for menu buttons (grouped on the left)
         self.menu_buttons_container = ctk.CTkFrame(
             self.custom_menu_bar,
@@ -112,7 +137,7 @@ class MainWindow(ctk.CTk):
             "fg_color": "transparent",
             "hover_color": COLORS["surface"],
             "text_color": COLORS["text"],
-            "font": ctk.CTkFont(size=12),
+            "font": self._menu_font,
             "corner_radius": 0,
             "height": 28,
             "anchor": "center"
@@ -152,74 +177,31 @@ class MainWindow(ctk.CTk):
         self._create_dropdowns()
 
     def _create_dropdowns(self):
-        """Create dropdown menu frames."""
-        dropdown_style = {
-            "fg_color": COLORS["surface"],
-            "corner_radius": 4,
-            "border_width": 1,
-            "border_color": COLORS["overlay"],
-        }
-
-        # Subtle hover - darker instead of bright purple
-        item_style = {
-            "fg_color": "transparent",
-            "hover_color": COLORS["overlay"],
-            "text_color": COLORS["text"],
-            "font": ctk.CTkFont(size=12),
-            "corner_radius": 4,
-            "height": 26,
-            "anchor": "w"
+        """Create the dropdown menus as native popup menus (no canvas-drawn widgets)."""
+        menu_style = {
+            "tearoff": False,
+            "bg": COLORS["surface"],
+            "fg": COLORS["text"],
+            "activebackground": COLORS["overlay"],
+            "activeforeground": COLORS["text"],
+            "relief": "flat",
+            "borderwidth": 1,
         }
 
         # File dropdown
-        self.file_dropdown = ctk.CTkFrame(self, **dropdown_style)
-        ctk.CTkButton(
-            self.file_dropdown,
-            text="Exit",
-            width=100,
-            command=lambda: self._menu_action(self._on_closing),
-            **item_style
-        ).pack(fill="x", padx=4, pady=4)
+        self.file_dropdown = tk.Menu(self, **menu_style)
+        self.file_dropdown.add_command(label="Exit", command=self._on_closing)
 
         # Projects dropdown
-        self.projects_dropdown = ctk.CTkFrame(self, **dropdown_style)
-        ctk.CTkButton(
-            self.projects_dropdown,
-            text="Add Project...",
-            width=130,
-            command=lambda: self._menu_action(self._on_add_project),
-            **item_style
-        ).pack(fill="x", padx=4, pady=(4, 2))
-
-        # Separator
-        sep = ctk.CTkFrame(self.projects_dropdown, fg_color=COLORS["overlay"], height=1)
-        sep.pack(fill="x", padx=8, pady=2)
-
-        ctk.CTkButton(
-            self.projects_dropdown,
-            text="Start All",
-            width=130,
-            command=lambda: self._menu_action(self._on_start_all),
-            **item_style
-        ).pack(fill="x", padx=4, pady=2)
-
-        ctk.CTkButton(
-            self.projects_dropdown,
-            text="Stop All",
-            width=130,
-            command=lambda: self._menu_action(self._on_stop_all),
-            **item_style
-        ).pack(fill="x", padx=4, pady=(2, 4))
+        self.projects_dropdown = tk.Menu(self, **menu_style)
+        self.projects_dropdown.add_command(label="Add Project...", command=self._on_add_project)
+        self.projects_dropdown.add_separator()
+        self.projects_dropdown.add_command(label="Start All", command=self._on_start_all)
+        self.projects_dropdown.add_command(label="Stop All", command=self._on_stop_all)
 
         # Help dropdown
-        self.help_dropdown = ctk.CTkFrame(self, **dropdown_style)
-        ctk.CTkButton(
-            self.help_dropdown,
-            text=f"About {APP_NAME}",
-            width=130,
-            command=lambda: self._menu_action(self._show_about),
-            **item_style
-        ).pack(fill="x", padx=4, pady=4)
+        self.help_dropdown = tk.Menu(self, **menu_style)
+        self.help_dropdown.add_command(label=f"About {APP_NAME}", command=self._show_about)
 
         # Store dropdown references
         self._dropdowns = {
@@ -229,32 +211,13 @@ class MainWindow(ctk.CTk):
         }
 
     def _toggle_dropdown(self, menu_name: str):
-        """Toggle a dropdown menu visibility."""
-        # If clicking the same menu, close it
-        if self._active_menu == menu_name:
-            self._hide_all_dropdowns()
-            return
-
-        # Hide any open dropdown
-        self._hide_all_dropdowns()
-
-        # Show the clicked dropdown
+        """Open a dropdown menu below its menu bar button."""
+        # The popup closes itself on selection or on a click elsewhere
         dropdown, btn = self._dropdowns[menu_name]
-
-        dropdown.place(in_=btn, relx=0, rely=1, x=0, y=0)
-        dropdown.tkraise()  # Bring to front above all other widgets
-        self._active_menu = menu_name
-
-    def _hide_all_dropdowns(self):
-        """Hide all dropdown menus."""
-        for dropdown, _ in self._dropdowns.values():
-            dropdown.place_forget()
-        self._active_menu = None
-
-    def _menu_action(self, action_func):
-        """Execute a menu action and close dropdown."""
-        self._hide_all_dropdowns()
-        action_func()
+        try:
+            dropdown.tk_popup(btn.winfo_rootx(), btn.winfo_rooty() + btn.winfo_height())
+        finally:
+            dropdown.grab_release()
 
     def _on_add_project(self):
         """Open add project dialog from menu."""
@@ -276,6 +239,10 @@ class MainWindow(ctk.CTk):
         """Setup the main UI layout."""
         # Initialize layout state
         self._layout_mode = "desktop"  # or "mobile"
+        self._resize_after_id = None  # Pending debounced layout check
+        self._window_size: tuple[int, int] | None = None  # Latest size from <Configure>
+        self._checked_size: tuple[int, int] | None = None  # Size the layout was last checked for
+        self._applied_layout = None  # Layout mode the widgets are currently gridded for
 
         # Configure initial grid
         self._configure_grid_desktop()
@@ -297,7 +264,7 @@ class MainWindow(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             self.status_bar,
             text="Ready",
-            font=ctk.CTkFont(size=11),
+            font=self._status_font,
             text_color=COLORS["subtext"],
             anchor="w"
         )
@@ -332,12 +299,34 @@ class MainWindow(ctk.CTk):
         self.grid_rowconfigure(3, weight=0)
 
     def _on_resize(self, event):
-        """Handle window resize to switch layouts."""
+        """Handle window resize; the layout check runs once resizing pauses."""
         if event.widget != self:
             return
 
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # The event carries the new size, so no winfo_* round-trips; the very first
+        # events can report 1x1 before the window is mapped
+        size = (event.width, event.height)
+        if size[0] <= 1 or size[1] <= 1:
+            size = (self.winfo_width(), self.winfo_height())
+        # Moving the window also fires <Configure>; nothing to do if the size is the same
+        if size == self._window_size:
+            return
+        self._window_size = size
+
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._do_resize_check)
+
+    def _do_resize_check(self):
+        """Switch layouts if the window's aspect ratio crossed the threshold."""
+        self._resize_after_id = None
+
+        # A drag that ends where it started needs no re-check
+        if self._window_size == self._checked_size:
+            return
+        self._checked_size = self._window_size
+
+        width, height = self._window_size
         aspect_ratio = width / height if height > 0 else 999
 
         new_mode = "desktop" if aspect_ratio >= 1.3 else "mobile"
@@ -348,19 +337,21 @@ class MainWindow(ctk.CTk):
 
     def _update_layout(self):
         """Update widget positions based on current layout mode."""
-        # Clear current grid
-        self.dashboard.grid_forget()
-        self.log_panel.grid_forget()
-        self.status_bar.grid_forget()
+        if self._applied_layout == self._layout_mode:
+            return
+        self._applied_layout = self._layout_mode
 
+        # grid() on an already managed widget just updates its options, so the widgets
+        # move in place instead of being forgotten and re-added; every option that
+        # differs between the layouts (columnspan included) is passed explicitly
         if self._layout_mode == "desktop":
             self._configure_grid_desktop()
 
             # Dashboard: Row 1, Col 0
-            self.dashboard.grid(row=1, column=0, padx=(10, 5), pady=10, sticky="nsew")
+            self.dashboard.grid(row=1, column=0, columnspan=1, padx=(10, 5), pady=10, sticky="nsew")
 
             # Logs: Row 1, Col 1
-            self.log_panel.grid(row=1, column=1, padx=(5, 10), pady=10, sticky="nsew")
+            self.log_panel.grid(row=1, column=1, columnspan=1, padx=(5, 10), pady=10, sticky="nsew")
 
             # Status bar: Row 2, Span 2
             self.status_bar.grid(row=2, column=0, columnspan=2, sticky="ew")
@@ -378,13 +369,33 @@ class MainWindow(ctk.CTk):
             self.status_bar.grid(row=3, column=0, columnspan=2, sticky="ew")
 
     def _on_status_changed(self, project_id: int, status: str):
-        """Handle project status change."""
-        self.after(0, lambda: self.dashboard.update_project_status(project_id, status))
-        self.after(0, self._update_status_bar)
+        """Handle project status change (called from worker threads)."""
+        self._status_queue.append((project_id, status))
+        # One Tk callback per burst instead of two per change
+        if not self._status_drain_scheduled:
+            self._status_drain_scheduled = True
+            self.after_idle(self._drain_status_queue)
+
+    def _drain_status_queue(self):
+        """Apply queued status changes in order, then refresh the status bar once."""
+        # Cleared before draining, so a change queued meanwhile either gets popped
+        # below or schedules a new drain. Changes are applied in order rather than
+        # collapsed, since e.g. stopped -> running must restart the uptime clock
+        self._status_drain_scheduled = False
+        applied = False
+        try:
+            while True:
+                self.dashboard.update_project_status(*self._status_queue.popleft())
+                applied = True
+        except IndexError:
+            pass
+        if applied:
+            self._update_status_bar()
 
     def _on_log_received(self, project_id: int, line: str):
-        """Handle new log line."""
-        self.after(0, lambda: self.log_panel.add_log(project_id, line))
+        """Handle new log line (called on a process reader thread)."""
+        # Parsed here, off the UI thread; the log panel drains its queue periodically
+        self.log_panel.submit_log(project_id, line)
 
     def _on_crash_detected(self, project_id: int, name: str, exit_code: int, logs: str):  # pylint: disable=unused-argument
         """Handle process crash."""
@@ -407,11 +418,18 @@ class MainWindow(ctk.CTk):
         """Update the status bar."""
         total = self.dashboard.get_project_count()
         running = self.dashboard.get_running_count()
+        if self._status_cache == (total, running):
+            return
+        self._status_cache = (total, running)
         self.status_label.configure(text=f"Projects: {total} | Running: {running}")
 
     def _on_closing(self):
         """Handle window close - stop all processes."""
-        running = self.dashboard.get_running_count()
+        # Reuse the count the status bar already computed when available
+        if self._status_cache is not None:
+            running = self._status_cache[1]
+        else:
+            running = self.dashboard.get_running_count()
 
         if running > 0:
             if not messagebox.askyesno(
@@ -420,5 +438,5 @@ class MainWindow(ctk.CTk):
             ):
                 return
 
-        self.process_manager.stop_all()
+        self.process_manager.stop_all(parallel=True)
         self.destroy()
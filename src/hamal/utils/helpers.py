@@ -2,10 +2,14 @@
 
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
-from hamal.core.project_scanner import ProjectScanner, get_all_script_files
+from hamal.core.project_scanner import ProjectScanner, ScanResult, get_all_script_files
+
+# Shared scanner; it keeps no per-scan state, so concurrent scans are safe
+_SCANNER = ProjectScanner()
 
 
 def resource_path(relative_path: str) -> Path:
@@ -25,6 +29,16 @@ def resource_path(relative_path: str) -> Path:
     return base_path / relative_path
 
 
+def scan_project(project_folder: str) -> ScanResult:
+    """
+    Scan a project folder once for both its entry file and interpreter.
+
+    Use this instead of calling detect_python_interpreter() and
+    detect_entry_file() back to back, which walks the folder twice.
+    """
+    return _SCANNER.scan(project_folder)
+
+
 def detect_python_interpreter(project_folder: str) -> str:
     """
     Detect the Python interpreter to use for a project.
@@ -32,9 +46,7 @@ def detect_python_interpreter(project_folder: str) -> str:
     Uses smart recursive scanning to find virtual environments.
     Returns empty string if no venv found (UI must warn user to select manually).
     """
-    scanner = ProjectScanner()
-    result = scanner.scan(project_folder)
-    return result.interpreter or ""
+    return scan_project(project_folder).interpreter or ""
 
 
 def detect_entry_file(project_folder: str) -> Optional[str]:
@@ -44,9 +56,7 @@ def detect_entry_file(project_folder: str) -> Optional[str]:
     Uses smart recursive scanning to find entrypoints in subdirectories.
     Returns the relative path from project root, or None if not found.
     """
-    scanner = ProjectScanner()
-    result = scanner.scan(project_folder)
-    return result.entrypoint
+    return scan_project(project_folder).entrypoint
 
 
 def get_python_files(project_folder: str) -> list[str]:
@@ -56,17 +66,20 @@ def get_python_files(project_folder: str) -> list[str]:
 
 def format_uptime(seconds: float) -> str:
     """Format seconds into a human-readable uptime string."""
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    if seconds < 3600:
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+    # Whole seconds once up front; divmod yields both parts in one step
+    total = int(seconds)
+    if total < 60:
+        return f"{total}s"
+    if total < 3600:
+        minutes, secs = divmod(total, 60)
         return f"{minutes}m {secs}s"
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    return f"{hours}h {minutes}m"
+    hours, rest = divmod(total, 3600)
+    return f"{hours}h {rest // 60}m"
 
 
 def open_folder_in_explorer(folder_path: str):
-    """Open a folder in Windows Explorer."""
-    os.startfile(folder_path)
+    """
+    Open a folder in Windows Explorer without blocking the caller.
+    os.startfile goes through the shell, which can stall for a while on first use.
+    """
+    threading.Thread(target=os.startfile, args=(folder_path,), daemon=True).start()
@@ -9,6 +9,17 @@ sys.path.append(str(current_dir))
 
 from hamal.core.config import get_database_path
 
+# Stored in PRAGMA user_version once NEW_COLUMNS are all present
+CURRENT_SCHEMA_VERSION = 4
+
+# Columns added after the initial schema: (name, column definition)
+NEW_COLUMNS = [
+    ("auto_restart", "BOOLEAN NOT NULL DEFAULT 0"),
+    ("schedule_start", "TEXT"),
+    ("schedule_stop", "TEXT"),
+    ("custom_scripts", "TEXT"),
+]
+
 def migrate():
     db_path = get_database_path()
     print(f"Migrating database at: {db_path}")
@@ -17,41 +28,39 @@ def migrate():
         print("Database not found. Nothing to migrate.")
         return
 
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode, so the explicit BEGIN/COMMIT below is the only transaction
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
     
     try:
+        # Already migrated: one header read instead of inspecting the table
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= CURRENT_SCHEMA_VERSION:
+            print("Database schema is up to date.")
+            return
+
+        cursor.execute("BEGIN")
+
         # Get existing columns
         cursor.execute("PRAGMA table_info(projects)")
-        columns = [info[1] for info in cursor.fetchall()]
-        print(f"Existing columns: {columns}")
+        columns = {info[1] for info in cursor.fetchall()}
+        print(f"Existing columns: {sorted(columns)}")
         
-        # Add auto_restart
-        if "auto_restart" not in columns:
-            print("Adding auto_restart column...")
-            cursor.execute("ALTER TABLE projects ADD COLUMN auto_restart BOOLEAN NOT NULL DEFAULT 0")
-            
-        # Add schedule_start
-        if "schedule_start" not in columns:
-            print("Adding schedule_start column...")
-            cursor.execute("ALTER TABLE projects ADD COLUMN schedule_start TEXT")
-
-        # Add schedule_stop
-        if "schedule_stop" not in columns:
-            print("Adding schedule_stop column...")
-            cursor.execute("ALTER TABLE projects ADD COLUMN schedule_stop TEXT")
-
-        # Add custom_scripts
-        if "custom_scripts" not in columns:
-            print("Adding custom_scripts column...")
-            cursor.execute("ALTER TABLE projects ADD COLUMN custom_scripts TEXT")
+        # All missing columns are added in the one transaction
+        for name, definition in NEW_COLUMNS:
+            if name not in columns:
+                print(f"Adding {name} column...")
+                cursor.execute(f"ALTER TABLE projects ADD COLUMN {name} {definition}")
             
-        conn.commit()
+        # Part of the same transaction, so it is only recorded if the columns were added
+        cursor.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
+        cursor.execute("COMMIT")
         print("Migration complete.")
         
     except Exception as e:
         print(f"Migration failed: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
     finally:
         conn.close()
 